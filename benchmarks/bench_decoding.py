@@ -0,0 +1,45 @@
+"""
+Parse-time benchmarks for the pluggable JSON decoding layer (helpers/decoding.py).
+
+Reports microseconds per message for every installed decoder on a Binance depth
+frame and on a 10k-market CLOB payload.
+
+    python benchmarks/bench_decoding.py
+"""
+import json
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from helpers.logger import logger
+from helpers.decoding import available_decoders, get_decoder
+from bench_models import make_depth_message, make_markets_payload
+
+DEPTH_ITERATIONS = 20_000
+MARKETS_ITERATIONS = 10
+
+def time_per_call(fn, arg, iterations: int) -> float:
+    fn(arg)  # Warm up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+if __name__ == "__main__":
+    logger.setLevel(logging.WARNING)
+    random.seed(7)
+
+    depth_message = make_depth_message()
+    markets_payload = json.dumps({"limit": 10000, "count": 10000, "next_cursor": "LTE=", "data": make_markets_payload()}).encode()
+
+    print(f"Depth frame: {len(depth_message)} bytes | Markets payload: {len(markets_payload) / 1e6:.1f} MB")
+    print(f"  {'decoder':10} {'depth us/msg':>14} {'markets us/msg':>16}")
+    for name in available_decoders():
+        decoder = get_decoder(name)
+        depth_us = time_per_call(decoder.decode_depth, depth_message, DEPTH_ITERATIONS)
+        markets_us = time_per_call(decoder.decode_markets, markets_payload, MARKETS_ITERATIONS)
+        print(f"  {name:10} {depth_us:14.1f} {markets_us:16,.0f}")
@@ -0,0 +1,76 @@
+"""
+Repricing benchmarks for the fair-value engine (services/fair_value.py).
+
+Reports microseconds per book update when repricing N markets with the vectorised
+engine, against a per-market scalar loop (FairValueStrategy.probability_up).
+
+    python benchmarks/bench_fair_value.py
+"""
+import logging
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from helpers.logger import logger
+from models.polymarket import MarketInfo
+from services.fair_value import FairValueEngine, market_expiry
+from strategies.fair_value import FairValueStrategy
+
+MARKET_COUNTS = [1, 10, 100, 1_000]
+UPDATES = 5_000
+
+def make_markets(count: int, spot: float) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        MarketInfo(
+            condition_id=f"0x{i:064x}",
+            question=f"Will Bitcoin be above ${spot:,.0f}? (15 min)",
+            yes_token=f"{i}-up",
+            no_token=f"{i}-down",
+            active=True,
+            strike=round(spot * (1 + random.uniform(-0.003, 0.003))),
+            end_time=now + timedelta(seconds=random.uniform(60, 900)),
+            yes_price=0.5,
+            no_price=0.5
+        )
+        for i in range(count)
+    ]
+
+def engine_update(engine: FairValueEngine, prices: list, now: float) -> float:
+    started = time.perf_counter()
+    for i, price in enumerate(prices):
+        engine.on_book_update(price, now + i * 0.1)
+    return (time.perf_counter() - started) / len(prices) * 1e6
+
+def scalar_update(strategy: FairValueStrategy, markets: list, prices: list, now: float) -> float:
+    expiries = [market_expiry(m) for m in markets]
+    started = time.perf_counter()
+    for i, price in enumerate(prices):
+        ts = now + i * 0.1
+        [strategy.probability_up(price, m.strike, max(0.0, expiry - ts)) for m, expiry in zip(markets, expiries)]
+    return (time.perf_counter() - started) / len(prices) * 1e6
+
+if __name__ == "__main__":
+    logger.setLevel(logging.WARNING)
+    random.seed(7)
+
+    spot = 60000.0
+    prices = [spot]
+    for _ in range(UPDATES - 1):
+        prices.append(prices[-1] * math.exp(random.gauss(0, 0.0001)))
+
+    print(f"Fair-value repricing per book update ({UPDATES} updates)")
+    print(f"  {'markets':>8} {'engine us':>12} {'scalar us':>12} {'speedup':>9}")
+    for count in MARKET_COUNTS:
+        markets = make_markets(count, spot)
+        engine = FairValueEngine()
+        engine.set_markets(markets)
+        now = time.time()
+        vectorised = engine_update(engine, prices, now)
+        scalar = scalar_update(FairValueStrategy(annual_vol=engine.vol.annualized()), markets, prices, now)
+        print(f"  {count:>8,d} {vectorised:12.1f} {scalar:12.1f} {scalar / vectorised:8.1f}x")
@@ -0,0 +1,118 @@
+"""
+Allocation and throughput benchmarks for the hot-path data models.
+
+Compares the original Pydantic-per-level / Pydantic-per-market paths with the slotted
+internal models now used by DataStreamer, PolymarketTrader and TradingEngine.
+
+    python benchmarks/bench_models.py
+"""
+import json
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from helpers.logger import logger
+from models.market import OrderBookWall
+from models.polymarket import ClobMarket
+from models.internal import BookLevel
+from services.trader import PolymarketTrader
+
+DEPTH_ITERATIONS = 5_000
+DISCOVERY_ITERATIONS = 5
+MARKET_COUNT = 10_000
+
+def make_depth_message(levels: int = 20) -> str:
+    price = 60000.0
+    bids = [[f"{price - i * 0.5:.2f}", f"{random.uniform(0.01, 5):.5f}"] for i in range(levels)]
+    asks = [[f"{price + (i + 1) * 0.5:.2f}", f"{random.uniform(0.01, 5):.5f}"] for i in range(levels)]
+    return json.dumps({"lastUpdateId": 1, "bids": bids, "asks": asks})
+
+def make_markets_payload(count: int = MARKET_COUNT) -> list:
+    markets = []
+    for i in range(count):
+        btc = i % 500 == 0
+        markets.append({
+            "condition_id": f"0x{i:064x}",
+            "conditionId": f"0x{i:064x}",
+            "question": f"Bitcoin Up or Down - 15 min window {i}" if btc else f"Will team {i} win the match?",
+            "description": "Lorem ipsum " * 20,
+            "market_slug": f"market-{i}",
+            "active": i % 3 != 0,
+            "closed": i % 7 == 0,
+            "accepting_orders": True,
+            "end_date_iso": "2026-10-19T15:15:00Z",
+            "tags": ["Crypto", "Bitcoin"] if btc else ["Sports"],
+            "tokens": [
+                {"token_id": str(10**20 + i), "outcome": "Up", "price": 0.5, "winner": False},
+                {"token_id": str(2 * 10**20 + i), "outcome": "Down", "price": 0.5, "winner": False}
+            ]
+        })
+    return markets
+
+def pydantic_depth(message: str):
+    data = json.loads(message)
+    bids = [OrderBookWall(price=float(p), volume=float(q)) for p, q in data["bids"]]
+    asks = [OrderBookWall(price=float(p), volume=float(q)) for p, q in data["asks"]]
+    return bids, asks
+
+def internal_depth(message: str):
+    data = json.loads(message)
+    bids = [BookLevel(float(p), float(q)) for p, q in data["bids"]]
+    asks = [BookLevel(float(p), float(q)) for p, q in data["asks"]]
+    return bids, asks
+
+def pydantic_discovery(raw_markets: list):
+    """The original path: validate every market before filtering."""
+    markets = []
+    for m in raw_markets:
+        try:
+            markets.append(ClobMarket(**m))
+        except Exception:
+            pass
+    return [m for m in markets if m.active and not m.closed and m.accepting_orders and "bitcoin" in (m.question or "").lower()]
+
+def measure(fn, arg, iterations: int):
+    """Returns (microseconds per call, bytes retained by the result, peak bytes allocated during the call)."""
+    fn(arg)  # Warm up
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(arg)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    result = fn(arg)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed / iterations * 1e6, retained, peak
+
+def report(title: str, baseline, optimised):
+    print(f"\n{title}")
+    print(f"  {'':12} {'us/op':>12} {'retained B':>12} {'peak B':>12}")
+    for name, (us, retained, peak) in (("pydantic", baseline), ("internal", optimised)):
+        print(f"  {name:12} {us:12.1f} {retained:12,d} {peak:12,d}")
+    print(f"  speedup {baseline[0] / optimised[0]:.1f}x, peak allocation {baseline[2] / max(optimised[2], 1):.1f}x lower")
+
+if __name__ == "__main__":
+    logger.setLevel(logging.WARNING)
+    random.seed(7)
+
+    message = make_depth_message()
+    report(
+        f"Depth message (20+20 levels, {DEPTH_ITERATIONS} iterations)",
+        measure(pydantic_depth, message, DEPTH_ITERATIONS),
+        measure(internal_depth, message, DEPTH_ITERATIONS)
+    )
+
+    payload = make_markets_payload()
+    report(
+        f"Market discovery pass ({MARKET_COUNT} markets, {DISCOVERY_ITERATIONS} iterations)",
+        measure(pydantic_discovery, payload, DISCOVERY_ITERATIONS),
+        measure(PolymarketTrader.filter_btc_markets, payload, DISCOVERY_ITERATIONS)
+    )
@@ -7,6 +7,9 @@ from helpers.service_locator import service_locator
 from services.trading_engine import TradingEngine
 from services.data_streamer import DataStreamer
 from services.trader import PolymarketTrader
+from services.loop_monitor import LoopMonitor
+from services.strategy_ensemble import StrategyEnsemble
+from services.fair_value import FairValueEngine
 
 app = FastAPI(title="Polymarket Signal Sniper API")
 
@@ -25,7 +28,31 @@ async def health():
 @app.get("/signals")
 async def get_signals():
     engine = service_locator.get(TradingEngine)
-    return {"signals": engine.latest_signals}
+    signals = engine.latest_signals.to_model() if engine.latest_signals else None
+    return {"signals": signals}
+
+@app.get("/feeds")
+async def get_feed_stats():
+    streamer = service_locator.get(DataStreamer)
+    return {"binance": streamer.get_feed_stats()}
+
+@app.get("/loop")
+async def get_loop_stats():
+    """Event-loop lag percentiles and stall attribution per service."""
+    monitor = service_locator.get(LoopMonitor)
+    return monitor.get_stats()
+
+@app.get("/strategies")
+async def get_strategy_stats():
+    """Per-strategy latency and decisions, plus the latest ensemble round."""
+    ensemble = service_locator.get(StrategyEnsemble)
+    return ensemble.get_stats()
+
+@app.get("/fair-value")
+async def get_fair_value():
+    """Model fair value and edge versus market price for every tracked market's Up/Down tokens."""
+    engine = service_locator.get(FairValueEngine)
+    return {**engine.get_stats(), "quotes": engine.quotes()}
 
 @app.get("/status", response_model=StatusResponse)
 async def get_status():
@@ -54,6 +81,8 @@ async def confirm_trade(request: CommandRequest):
     engine = service_locator.get(TradingEngine)
     if not engine.latest_brief:
         raise HTTPException(status_code=400, detail="No pending trade brief to confirm.")
+    if engine.latest_brief.get("restored"):
+        raise HTTPException(status_code=409, detail="Brief was restored from a snapshot; wait for a live brief.")
     
     await engine.confirmation_queue.put(request.command)
     return {"message": f"Command '{request.command}' sent to engine."}
@@ -2,6 +2,15 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from helpers.constants import (
+    BINANCE_WS_URL_TEMPLATE,
+    BINANCE_STANDBY_WS_URL_TEMPLATE,
+    BINANCE_FUNDING_URL_TEMPLATE,
+    COINGLASS_LIQUIDATION_URL,
+    COINGLASS_LIQUIDATION_MAP_URL,
+    ENGINE_TICK_INTERVAL
+)
+
 class Config:
     def __init__(self):
         # 1. Determine environment (default to local)
@@ -28,5 +37,18 @@ class Config:
         
         self.ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
         self.COINGLASS_API_KEY = os.getenv("COINGLASS_API_KEY")
+        self.ANTHROPIC_BASE_URL = os.getenv("ANTHROPIC_BASE_URL")
+
+        # 5. Endpoint overrides (point these at local stand-ins for soak testing)
+        self.BINANCE_WS_URL_TEMPLATE = os.getenv("BINANCE_WS_URL_TEMPLATE", BINANCE_WS_URL_TEMPLATE)
+        self.BINANCE_STANDBY_WS_URL_TEMPLATE = os.getenv("BINANCE_STANDBY_WS_URL_TEMPLATE", BINANCE_STANDBY_WS_URL_TEMPLATE)
+        self.BINANCE_FUNDING_URL_TEMPLATE = os.getenv("BINANCE_FUNDING_URL_TEMPLATE", BINANCE_FUNDING_URL_TEMPLATE)
+        self.COINGLASS_LIQUIDATION_URL = os.getenv("COINGLASS_LIQUIDATION_URL", COINGLASS_LIQUIDATION_URL)
+        self.COINGLASS_LIQUIDATION_MAP_URL = os.getenv("COINGLASS_LIQUIDATION_MAP_URL", COINGLASS_LIQUIDATION_MAP_URL)
+
+        self.API_HOST = os.getenv("API_HOST", "0.0.0.0")
+        self.API_PORT = int(os.getenv("API_PORT", "8000"))
+        self.API_LOG_LEVEL = os.getenv("API_LOG_LEVEL", "info")
+        self.ENGINE_TICK_INTERVAL = float(os.getenv("ENGINE_TICK_INTERVAL", ENGINE_TICK_INTERVAL))
 
 settings = Config()
@@ -16,7 +16,7 @@ Polymarket Current Odds:
 Instructions:
 1. Identify the current 15m BTC Trend (Bullish/Bearish/Neutral).
 2. Analyze Binance Order Book Walls for immediate support/resistance.
-3. Factor in Funding Rates and Liquidation clusters.
+3. Factor in Funding Rates and Liquidation clusters (`cluster_above`/`cluster_below` are the nearest significant liquidation levels; price tends to be drawn toward them).
 4. If Binance walls and funding suggest a drop, but 'DOWN' shares are still < $0.52, recommend 'BUY_DOWN'.
 5. Conversely, if indicators suggest a pump and 'UP' shares are cheap, recommend 'BUY_UP'.
 
@@ -34,12 +34,76 @@ TAKER_FEE = 0.0315  # 3.15%
 BTC_MARKET_QUESTION_FILTER = "Bitcoin"
 TIME_FRAME_FILTER = "15-minute"
 DEFAULT_TRADE_AMOUNT = 10
+ENGINE_TICK_INTERVAL = 10  # Seconds between engine decisions
+TICK_LATENCY_HISTORY = 1000
+CLOB_MARKETS_PATH = "/markets"
+CLOB_HTTP_TIMEOUT = 10
 
 # Data Streamer Constants
 BINANCE_WS_URL_TEMPLATE = "wss://stream.binance.com:9443/ws/{symbol}@depth20@100ms"
+BINANCE_STANDBY_WS_URL_TEMPLATE = "wss://data-stream.binance.vision/ws/{symbol}@depth20@100ms"
 BINANCE_FUNDING_URL_TEMPLATE = "https://fapi.binance.com/fapi/v1/premiumIndex?symbol={symbol}"
 COINGLASS_LIQUIDATION_URL = "https://open-api.coinglass.com/public/v2/liquidation_info"
+COINGLASS_LIQUIDATION_MAP_URL = "https://open-api.coinglass.com/public/v2/liquidation_map"
 
 DEFAULT_CRYPTO_SYMBOL = "BTC"
 DEFAULT_BINANCE_SYMBOL = "BTCUSDT"
 DEFAULT_WS_SYMBOL = "btcusdt"
+
+# Feed Connection Constants
+FEED_MESSAGE_INTERVAL = 0.1  # Binance depth20@100ms pushes every 100ms
+FEED_STALE_AFTER = 2.0  # Seconds without a message before a connection (and the book) is stale
+FEED_FAILOVER_LAG_FACTOR = 3  # The active connection must be this many message intervals late before the standby is promoted
+FEED_BACKOFF_BASE = 0.5
+FEED_BACKOFF_MAX = 30.0
+FEED_PING_INTERVAL = 10
+FEED_PING_TIMEOUT = 10
+BINANCE_HOT_STANDBY = True
+
+# Event Loop Monitor Constants
+LOOP_MONITOR_INTERVAL = 0.05  # Expected tick of the lag probe
+LOOP_STALL_THRESHOLD = 0.1  # Lag beyond this is treated as a stall and stack-sampled
+LOOP_SAMPLE_INTERVAL = 0.025  # Watchdog thread sampling period
+LOOP_LAG_HISTORY = 6000  # ~5 minutes of lag samples
+LOOP_STALL_HISTORY = 200
+LOOP_STACK_DEPTH = 12
+
+# Warm-Restart Snapshot Constants
+SNAPSHOT_PATH = "state/snapshot.json"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_INTERVAL = 5  # Seconds between snapshots
+SNAPSHOT_MAX_AGE = 900  # Snapshots older than one 15m window are ignored entirely
+SNAPSHOT_BOOK_MAX_AGE = 10
+SNAPSHOT_MARKET_MAX_AGE = 300
+SNAPSHOT_SIGNALS_MAX_AGE = 60
+SNAPSHOT_LIQUIDATION_MAX_AGE = 300
+SIGNAL_HISTORY_SIZE = 360  # One hour of engine ticks
+
+# Liquidation Map Constants
+LIQUIDATION_BUCKET_SIZE = 50.0  # USD per price bucket
+LIQUIDATION_SIGNIFICANT_USD = 5_000_000  # Bucket volume that makes a cluster "significant"
+LIQUIDATION_CLUSTER_RANGE_PCT = 0.02  # Search window around the current price
+LIQUIDATION_MAP_REFRESH = 60  # Seconds between liquidation map fetches
+
+# Strategy Ensemble Constants
+STRATEGY_AGGREGATION = "escalate"  # "escalate": run expensive strategies (Claude) only when the cheap ones disagree; "vote": run all, weighted vote
+STRATEGY_WEIGHTS = {"llm": 2.0, "wall_imbalance": 1.0, "fair_value": 1.5}
+STRATEGY_PROCESS_WORKERS = 2
+STRATEGY_THREAD_WORKERS = 4  # Dedicated pool for blocking strategies, separate from asyncio's default executor
+STRATEGY_MAX_ENTRY_PRICE = 0.60
+WALL_IMBALANCE_THRESHOLD = 0.3
+FAIR_VALUE_DEFAULT_VOL = 0.5  # Annualised BTC volatility used until enough live samples exist
+FAIR_VALUE_MIN_EDGE = 0.05
+SECONDS_PER_YEAR = 31_536_000
+
+# Fair-Value Engine Constants
+FAIR_VALUE_SAMPLE_INTERVAL = 1.0  # Seconds between mid-price samples for realised volatility
+FAIR_VALUE_VOL_WINDOW = 900  # Samples (returns) in the rolling realised-volatility window
+FAIR_VALUE_MIN_VOL_SAMPLES = 60  # Below this, FAIR_VALUE_DEFAULT_VOL is used
+FAIR_VALUE_MAX_SAMPLE_GAP = 10.0  # Seconds; a longer gap (stale feed) restarts the return series
+FAIR_VALUE_PRICE_HISTORY = 1800  # Samples kept to look up window-open prices
+FAIR_VALUE_MARKET_REFRESH = 60  # Seconds between market catalog refreshes (windows expire)
+MARKET_WINDOW_SECONDS = 900  # Length of an Up/Down window; its strike is the spot price at the open
+
+# Decoding Constants
+JSON_DECODER = "auto"  # "auto" picks the fastest installed of: msgspec, orjson, json
@@ -0,0 +1,126 @@
+import json
+from typing import List, NamedTuple, Optional, Tuple, TypedDict
+
+from helpers.logger import logger
+from helpers.constants import JSON_DECODER
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class DepthFrame(NamedTuple):
+    bids: List[Tuple[float, float]]
+    asks: List[Tuple[float, float]]
+    last_update_id: Optional[int] = None
+
+class MarketToken(TypedDict, total=False):
+    token_id: str
+    outcome: Optional[str]
+    price: Optional[float]
+
+class MarketFields(TypedDict, total=False):
+    """The only market fields PolymarketTrader.filter_btc_markets reads."""
+    conditionId: str
+    question: Optional[str]
+    title: Optional[str]
+    active: Optional[bool]
+    closed: Optional[bool]
+    accepting_orders: Optional[bool]
+    end_date_iso: Optional[str]
+    tokens: Optional[List[MarketToken]]
+    clobTokenIds: Optional[List[str]]
+
+class StdlibDecoder:
+    """Baseline decoder on the stdlib `json` module. Always available."""
+    name = "json"
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def decode_depth(self, data) -> DepthFrame:
+        """Decodes a Binance depth frame into (price, qty) float pairs."""
+        obj = self.loads(data)
+        return DepthFrame(
+            bids=[(float(p), float(q)) for p, q in obj["bids"]],
+            asks=[(float(p), float(q)) for p, q in obj["asks"]],
+            last_update_id=obj.get("lastUpdateId")
+        )
+
+    def decode_markets(self, data) -> List[dict]:
+        """Decodes a CLOB markets payload (page envelope or bare list) into market dicts."""
+        obj = self.loads(data)
+        if isinstance(obj, dict):
+            return obj.get("data", [])
+        return obj if isinstance(obj, list) else []
+
+class OrjsonDecoder(StdlibDecoder):
+    """Same shapes as the stdlib decoder, with orjson doing the parsing."""
+    name = "orjson"
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+class MsgspecDecoder(StdlibDecoder):
+    """
+    Typed decoding with msgspec: depth levels are converted from strings to floats
+    while parsing, and market payloads materialise only the `MarketFields` keys.
+    Payloads that don't match the expected schema fall back to a full decode.
+    """
+    name = "msgspec"
+
+    def __init__(self):
+        class _DepthFrame(msgspec.Struct):
+            bids: List[Tuple[float, float]]
+            asks: List[Tuple[float, float]]
+            lastUpdateId: Optional[int] = None
+
+        class _MarketPage(msgspec.Struct):
+            data: List[MarketFields] = []
+
+        self._any = msgspec.json.Decoder()
+        self._depth = msgspec.json.Decoder(_DepthFrame, strict=False)
+        self._page = msgspec.json.Decoder(_MarketPage)
+        self._list = msgspec.json.Decoder(List[MarketFields])
+
+    def loads(self, data):
+        return self._any.decode(data)
+
+    def decode_depth(self, data) -> DepthFrame:
+        frame = self._depth.decode(data)
+        return DepthFrame(bids=frame.bids, asks=frame.asks, last_update_id=frame.lastUpdateId)
+
+    def decode_markets(self, data) -> List[dict]:
+        try:
+            if data.lstrip()[:1] in (b"[", "["):
+                return self._list.decode(data)
+            return self._page.decode(data).data
+        except msgspec.ValidationError as e:
+            logger.debug(f"Market payload did not match the partial schema ({e}). Decoding fully.")
+            return super().decode_markets(data)
+
+DECODERS = {"json": StdlibDecoder, "orjson": OrjsonDecoder, "msgspec": MsgspecDecoder}
+
+def available_decoders() -> List[str]:
+    names = ["json"]
+    if orjson:
+        names.append("orjson")
+    if msgspec:
+        names.append("msgspec")
+    return names
+
+def get_decoder(name: str = "auto") -> StdlibDecoder:
+    """Returns the named decoder, or the fastest installed one for "auto"."""
+    if name == "auto":
+        name = available_decoders()[-1]
+    if name not in available_decoders():
+        raise ValueError(f"Decoder '{name}' is not available. Installed: {available_decoders()}")
+    return DECODERS[name]()
+
+# Global decoder instance
+decoder = get_decoder(JSON_DECODER)
@@ -8,6 +8,13 @@ from services.brain import Brain
 from services.trader import PolymarketTrader
 from services.trading_engine import TradingEngine
 from services.notification_service import NotificationService
+from services.loop_monitor import LoopMonitor
+from services.snapshot_service import SnapshotService
+from services.strategy_ensemble import StrategyEnsemble
+from services.fair_value import FairValueEngine
+from strategies.llm_strategy import LLMStrategy
+from strategies.wall_imbalance import WallImbalanceStrategy
+from strategies.fair_value import FairValueStrategy
 
 async def main():
     """
@@ -28,17 +35,31 @@ async def main():
 
         # 2. Initialize Services
         streamer = DataStreamer(
-            coinglass_api_key=settings.COINGLASS_API_KEY
+            coinglass_api_key=settings.COINGLASS_API_KEY,
+            ws_url_template=settings.BINANCE_WS_URL_TEMPLATE,
+            standby_ws_url_template=settings.BINANCE_STANDBY_WS_URL_TEMPLATE,
+            funding_url_template=settings.BINANCE_FUNDING_URL_TEMPLATE,
+            liquidation_url=settings.COINGLASS_LIQUIDATION_URL,
+            liquidation_map_url=settings.COINGLASS_LIQUIDATION_MAP_URL
         )
-        brain = Brain(api_key=settings.ANTHROPIC_API_KEY)
+        brain = Brain(api_key=settings.ANTHROPIC_API_KEY, base_url=settings.ANTHROPIC_BASE_URL)
         trader = PolymarketTrader(
             settings.POLYGON_PRIVATE_KEY, 
             settings.CLOB_API_KEY, 
             settings.CLOB_SECRET, 
-            settings.CLOB_PASSPHRASE
+            settings.CLOB_PASSPHRASE,
+            host=settings.CLOB_HOST
         )
         notifier = NotificationService()
-        engine = TradingEngine()
+        engine = TradingEngine(tick_interval=settings.ENGINE_TICK_INTERVAL)
+        loop_monitor = LoopMonitor()
+        snapshots = SnapshotService()
+        fair_value = FairValueEngine()
+        ensemble = StrategyEnsemble([
+            LLMStrategy(brain),
+            WallImbalanceStrategy(),
+            FairValueStrategy(engine=fair_value)
+        ])
 
         # 3. Register Services in Locator
         service_locator.register(DataStreamer, streamer)
@@ -46,20 +67,28 @@ async def main():
         service_locator.register(PolymarketTrader, trader)
         service_locator.register(NotificationService, notifier)
         service_locator.register(TradingEngine, engine)
+        service_locator.register(LoopMonitor, loop_monitor)
+        service_locator.register(SnapshotService, snapshots)
+        service_locator.register(StrategyEnsemble, ensemble)
+        service_locator.register(FairValueEngine, fair_value)
         
         # 4. Initialize API Server
         import uvicorn
         from api.server import app
-        config = uvicorn.Config(app, host="0.0.0.0", port=8000, log_level="info")
+        config = uvicorn.Config(app, host=settings.API_HOST, port=settings.API_PORT, log_level=settings.API_LOG_LEVEL)
         server = uvicorn.Server(config)
 
-        logger.info("Application bootstrap complete. Starting Trading Engine & API Server (Port 8000)...")
+        logger.info(f"Application bootstrap complete. Starting Trading Engine & API Server (Port {settings.API_PORT})...")
 
         # 5. Start the Application Workflow and API Server concurrently
-        await asyncio.gather(
-            engine.run(),
-            server.serve()
-        )
+        try:
+            await asyncio.gather(
+                engine.run(),
+                server.serve(),
+                loop_monitor.run()
+            )
+        finally:
+            ensemble.shutdown()
 
     except Exception as e:
         logger.critical(f"Failed to bootstrap application: {e}", exc_info=True)
@@ -0,0 +1,74 @@
+"""
+Lightweight internal equivalents of the hot-path Pydantic models.
+
+These are built per depth level per message and per tick, so they are plain slotted
+dataclasses with no validation. Convert with `to_model()` only at the edges (API
+responses, LLM prompts, snapshots).
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from models.market import MarketSignals, OrderBookWall, OrderBookWalls, FundingInfo, LiquidationData
+from models.polymarket import PolymarketOdds
+
+@dataclass(slots=True)
+class BookLevel:
+    price: float
+    volume: float
+
+    def to_model(self) -> OrderBookWall:
+        return OrderBookWall(price=self.price, volume=self.volume)
+
+@dataclass(slots=True)
+class BookWalls:
+    top_bid_walls: List[BookLevel]
+    top_ask_walls: List[BookLevel]
+
+    def to_model(self) -> OrderBookWalls:
+        return OrderBookWalls(
+            top_bid_walls=[w.to_model() for w in self.top_bid_walls],
+            top_ask_walls=[w.to_model() for w in self.top_ask_walls]
+        )
+
+@dataclass(slots=True)
+class SignalSnapshot:
+    timestamp: datetime
+    btc_price: float
+    order_book: BookWalls
+    funding: Optional[FundingInfo]
+    liquidations: LiquidationData
+
+    def to_model(self) -> MarketSignals:
+        return MarketSignals(
+            timestamp=self.timestamp,
+            btc_price=self.btc_price,
+            order_book=self.order_book.to_model(),
+            funding=self.funding,
+            liquidations=self.liquidations
+        )
+
+    @classmethod
+    def from_model(cls, model: MarketSignals) -> "SignalSnapshot":
+        return cls(
+            timestamp=model.timestamp,
+            btc_price=model.btc_price,
+            order_book=BookWalls(
+                top_bid_walls=[BookLevel(w.price, w.volume) for w in model.order_book.top_bid_walls],
+                top_ask_walls=[BookLevel(w.price, w.volume) for w in model.order_book.top_ask_walls]
+            ),
+            funding=model.funding,
+            liquidations=model.liquidations
+        )
+
+@dataclass(slots=True)
+class OddsSnapshot:
+    yes_price: float
+    no_price: float
+
+    def to_model(self) -> PolymarketOdds:
+        return PolymarketOdds(yes_price=self.yes_price, no_price=self.no_price)
+
+    @classmethod
+    def from_model(cls, model: PolymarketOdds) -> "OddsSnapshot":
+        return cls(yes_price=model.yes_price, no_price=model.no_price)
@@ -14,9 +14,16 @@ class FundingInfo(BaseModel):
     current_funding_rate: float
     funding_rate_1h_avg: float
 
+class LiquidationCluster(BaseModel):
+    price: float
+    volume: float
+    distance_pct: float
+
 class LiquidationData(BaseModel):
     short_vol: float
     long_vol: float
+    cluster_above: Optional[LiquidationCluster] = None
+    cluster_below: Optional[LiquidationCluster] = None
 
 class MarketSignals(BaseModel):
     timestamp: datetime
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import List, Optional
+from datetime import datetime
 
 class PolymarketOdds(BaseModel):
     yes_price: float
@@ -11,11 +12,28 @@ class MarketInfo(BaseModel):
     yes_token: str
     no_token: str
     active: bool
+    strike: Optional[float] = None
+    end_time: Optional[datetime] = None
+    yes_price: Optional[float] = None
+    no_price: Optional[float] = None
+
+class FairValueQuote(BaseModel):
+    condition_id: str
+    question: str
+    strike: Optional[float]
+    seconds_remaining: Optional[float]
+    fair_up: Optional[float]
+    fair_down: Optional[float]
+    up_price: Optional[float]
+    down_price: Optional[float]
+    up_edge: Optional[float]
+    down_edge: Optional[float]
 
 class ClobToken(BaseModel):
     model_config = {"extra": "ignore"}
     token_id: str
     outcome: str
+    price: Optional[float] = None
 
 class ClobMarket(BaseModel):
     model_config = {"extra": "ignore"}
@@ -26,5 +44,6 @@ class ClobMarket(BaseModel):
     active: bool = False
     closed: bool = False
     accepting_orders: bool = False
+    end_date_iso: Optional[str] = None
     tokens: Optional[List[ClobToken]] = None
     clobTokenIds: Optional[List[str]] = None
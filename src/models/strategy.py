@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class SignalFeatures(BaseModel):
+    """Features derived once per tick and shared by every strategy."""
+    condition_id: Optional[str] = None
+    btc_price: float
+    bid_wall_volume: float
+    ask_wall_volume: float
+    wall_imbalance: float
+    funding_rate: float
+    liquidation_skew: float
+    cluster_pull: float
+    yes_price: float
+    no_price: float
+    strike: Optional[float] = None
+    seconds_remaining: Optional[float] = None
+    distance_to_strike_pct: Optional[float] = None
+
+class StrategyResult(BaseModel):
+    name: str
+    action: str
+    confidence: float
+    reasoning: str
+    latency_ms: float
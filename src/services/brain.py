@@ -4,19 +4,18 @@ import anthropic
 from helpers.logger import logger
 
 from helpers.constants import AI_MODEL, AI_CONFIDENCE_THRESHOLD, SYSTEM_PROMPT, BRAIN_PROMPT_TEMPLATE
-from models.market import MarketSignals
-from models.polymarket import PolymarketOdds
+from models.internal import SignalSnapshot, OddsSnapshot
 from models.ai import AIDecision
 
 class Brain:
-    def __init__(self, api_key: str):
-        self.client = anthropic.Anthropic(api_key=api_key)
+    def __init__(self, api_key: str, base_url: str = None):
+        self.client = anthropic.Anthropic(api_key=api_key, base_url=base_url)
 
-    def analyze_market(self, signals: MarketSignals, odds: PolymarketOdds) -> AIDecision:
+    def analyze_market(self, signals: SignalSnapshot, odds: OddsSnapshot) -> AIDecision:
         """Uses Claude to decide on a trade based on signals and current odds."""
         prompt = BRAIN_PROMPT_TEMPLATE.format(
-            signals=signals.model_dump_json(indent=2),
-            odds=odds.model_dump_json(indent=2),
+            signals=signals.to_model().model_dump_json(indent=2),
+            odds=odds.to_model().model_dump_json(indent=2),
             threshold=AI_CONFIDENCE_THRESHOLD
         ).strip()
         
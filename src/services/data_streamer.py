@@ -1,51 +1,119 @@
 import asyncio
+import heapq
 import json
+import time
 import requests
-import websockets
 from datetime import datetime
-from typing import List
+from typing import Callable, List, Optional
 
 from helpers.logger import logger
+from helpers.decoding import decoder
 from helpers.constants import (
     BINANCE_WS_URL_TEMPLATE,
+    BINANCE_STANDBY_WS_URL_TEMPLATE,
     BINANCE_FUNDING_URL_TEMPLATE,
     COINGLASS_LIQUIDATION_URL,
+    COINGLASS_LIQUIDATION_MAP_URL,
+    LIQUIDATION_CLUSTER_RANGE_PCT,
+    LIQUIDATION_MAP_REFRESH,
     DEFAULT_CRYPTO_SYMBOL,
     DEFAULT_BINANCE_SYMBOL,
-    DEFAULT_WS_SYMBOL
-)
-from models.market import (
-    MarketSignals, 
-    OrderBookWall, 
-    OrderBookWalls, 
-    FundingInfo, 
-    LiquidationData
+    DEFAULT_WS_SYMBOL,
+    BINANCE_HOT_STANDBY
 )
+from models.market import FundingInfo, LiquidationData
+from models.internal import BookLevel, BookWalls, SignalSnapshot
+from services.feed_connection import FeedConnectionManager
+from services.liquidation_map import LiquidationMap, parse_liquidation_levels
 
 class DataStreamer:
-    def __init__(self, coinglass_api_key: str = None):
+    def __init__(
+        self,
+        coinglass_api_key: str = None,
+        ws_url_template: str = BINANCE_WS_URL_TEMPLATE,
+        standby_ws_url_template: str = BINANCE_STANDBY_WS_URL_TEMPLATE,
+        hot_standby: bool = BINANCE_HOT_STANDBY,
+        funding_url_template: str = BINANCE_FUNDING_URL_TEMPLATE,
+        liquidation_url: str = COINGLASS_LIQUIDATION_URL,
+        liquidation_map_url: str = COINGLASS_LIQUIDATION_MAP_URL,
+        liquidation_map_fixture: Optional[str] = None
+    ):
         self.coinglass_api_key = coinglass_api_key
+        self.ws_url_template = ws_url_template
+        self.standby_ws_url_template = standby_ws_url_template
+        self.hot_standby = hot_standby
+        self.funding_url_template = funding_url_template
+        self.liquidation_url = liquidation_url
+        self.liquidation_map_url = liquidation_map_url
+        self.liquidation_map_fixture = liquidation_map_fixture
         
-        self.binance_depth_bids: List[OrderBookWall] = []
-        self.binance_depth_asks: List[OrderBookWall] = []
+        self.binance_depth_bids: List[BookLevel] = []
+        self.binance_depth_asks: List[BookLevel] = []
+        self.book_valid = False
+        self.book_updated_at: Optional[float] = None
+        self.last_update_id: Optional[int] = None
+        self.out_of_order_frames = 0
+        self.feed: Optional[FeedConnectionManager] = None
+        self.liquidation_map = LiquidationMap()
+        self.book_listeners: List[Callable[[float, float], None]] = []
+
+    def add_book_listener(self, listener: Callable[[float, float], None]):
+        """Registers `listener(mid_price, timestamp)`, called on every depth update. It must be fast and non-blocking."""
+        if listener not in self.book_listeners:
+            self.book_listeners.append(listener)
 
     async def start_binance_websocket(self, symbol: str = DEFAULT_WS_SYMBOL):
-        """Streams Binance depth data via WebSocket."""
-        url = BINANCE_WS_URL_TEMPLATE.format(symbol=symbol.lower())
-        while True:
-            try:
-                async with websockets.connect(url) as websocket:
-                    logger.info(f"Connected to Binance WebSocket for {symbol}")
-                    while True:
-                        message = await websocket.recv()
-                        data = json.loads(message)
-                        self.binance_depth_bids = [OrderBookWall(price=float(p), volume=float(q)) for p, q in data["bids"]]
-                        self.binance_depth_asks = [OrderBookWall(price=float(p), volume=float(q)) for p, q in data["asks"]]
-            except Exception as e:
-                logger.error(f"Binance WebSocket error: {e}. Reconnecting in 5s...")
-                await asyncio.sleep(5)
+        """Streams Binance depth data via a managed WebSocket connection (with optional hot standby)."""
+        self.feed = FeedConnectionManager(
+            self.ws_url_template.format(symbol=symbol.lower()),
+            on_message=self._on_depth_message,
+            on_stale=self._invalidate_book,
+            hot_standby=self.hot_standby,
+            standby_url=self.standby_ws_url_template.format(symbol=symbol.lower()),
+            name=f"binance-{symbol.lower()}"
+        )
+        await self.feed.run()
+
+    def _on_depth_message(self, message: str):
+        frame = decoder.decode_depth(message)
+        if frame.last_update_id is not None:
+            # After a failover the new connection may still deliver a book older than the one we have
+            if self.last_update_id is not None and frame.last_update_id <= self.last_update_id:
+                self.out_of_order_frames += 1
+                return
+            self.last_update_id = frame.last_update_id
+        self.binance_depth_bids = [BookLevel(p, q) for p, q in frame.bids]
+        self.binance_depth_asks = [BookLevel(p, q) for p, q in frame.asks]
+        self.book_valid = True
+        self.book_updated_at = time.time()
+
+        if self.book_listeners and frame.bids and frame.asks:
+            mid = (frame.bids[0][0] + frame.asks[0][0]) / 2
+            for listener in self.book_listeners:
+                try:
+                    listener(mid, self.book_updated_at)
+                except Exception as e:
+                    logger.error(f"Book listener failed: {e}")
+
+    def restore_book(self, bids: List[BookLevel], asks: List[BookLevel], updated_at: float):
+        """Seeds the book from a snapshot. It stays valid until live data replaces it or the feed goes stale."""
+        self.binance_depth_bids = bids
+        self.binance_depth_asks = asks
+        self.book_updated_at = updated_at
+        self.book_valid = True
+
+    def _invalidate_book(self):
+        logger.warning("Binance depth feed is stale. Order book marked invalid.")
+        self.book_valid = False
+        self.last_update_id = None  # Accept whatever the feed resumes with
+
+    def get_feed_stats(self) -> dict:
+        """Per-connection lag and reconnect statistics for the depth feed."""
+        if not self.feed:
+            return {}
+        return {**self.feed.get_stats(), "last_update_id": self.last_update_id, "out_of_order_frames": self.out_of_order_frames}
 
-    def get_order_book_walls(self, current_price: float, range_pct: float = 0.005) -> OrderBookWalls:
+    def get_order_book_walls(self, current_price: float, range_pct: float = 0.005) -> BookWalls:
         """Identifies Bid and Ask walls within a percentage range of current price."""
         lower_bound = current_price * (1 - range_pct)
         upper_bound = current_price * (1 + range_pct)
@@ -53,18 +121,15 @@ class DataStreamer:
         bid_walls = [b for b in self.binance_depth_bids if b.price >= lower_bound]
         ask_walls = [a for a in self.binance_depth_asks if a.price <= upper_bound]
         
-        bid_walls.sort(key=lambda x: x.volume, reverse=True)
-        ask_walls.sort(key=lambda x: x.volume, reverse=True)
-        
-        return OrderBookWalls(
-            top_bid_walls=bid_walls[:3],
-            top_ask_walls=ask_walls[:3]
+        return BookWalls(
+            top_bid_walls=heapq.nlargest(3, bid_walls, key=lambda x: x.volume),
+            top_ask_walls=heapq.nlargest(3, ask_walls, key=lambda x: x.volume)
         )
 
     def get_binance_funding_rate(self, symbol: str = DEFAULT_BINANCE_SYMBOL) -> FundingInfo:
         """Fetches current and historical funding rate for delta calculation."""
         try:
-            url = BINANCE_FUNDING_URL_TEMPLATE.format(symbol=symbol)
+            url = self.funding_url_template.format(symbol=symbol)
             response = requests.get(url).json()
             current_rate = float(response.get("lastFundingRate", 0))
             
@@ -82,7 +147,7 @@ class DataStreamer:
             return LiquidationData(short_vol=0, long_vol=0)
         
         try:
-            url = f"{COINGLASS_LIQUIDATION_URL}_info?symbol={symbol}&time_type=h1"
+            url = f"{self.liquidation_url}_info?symbol={symbol}&time_type=h1"
             headers = {"accept": "application/json", "coinglassApi": self.coinglass_api_key}
             response = requests.get(url, headers=headers).json()
             
@@ -97,12 +162,48 @@ class DataStreamer:
             
         return LiquidationData(short_vol=0, long_vol=0)
 
-    def get_all_signals(self, current_btc_price: float) -> MarketSignals:
+    def fetch_liquidation_levels(self, symbol: str = DEFAULT_CRYPTO_SYMBOL) -> list:
+        """Fetches level-by-level liquidation volume from the local fixture or Coinglass."""
+        if self.liquidation_map_fixture:
+            with open(self.liquidation_map_fixture, "r") as f:
+                return parse_liquidation_levels(json.load(f))
+
+        if not self.coinglass_api_key:
+            return []
+
+        url = f"{self.liquidation_map_url}?symbol={symbol}"
+        headers = {"accept": "application/json", "coinglassApi": self.coinglass_api_key}
+        return parse_liquidation_levels(decoder.loads(requests.get(url, headers=headers).content))
+
+    async def start_liquidation_map_updates(self, symbol: str = DEFAULT_CRYPTO_SYMBOL):
+        """Keeps the liquidation cluster index current. Fetches run off the event loop."""
+        if not (self.liquidation_map_fixture or self.coinglass_api_key):
+            logger.info("No Coinglass key or fixture configured. Liquidation map disabled.")
+            return
+
+        while True:
+            try:
+                levels = await asyncio.to_thread(self.fetch_liquidation_levels, symbol)
+                if levels:
+                    # Each fetch is the full map: buckets missing from it no longer hold liquidations
+                    self.liquidation_map.update(levels, replace=True)
+                else:
+                    logger.warning("Liquidation map fetch returned no levels. Keeping the previous map.")
+                logger.debug(f"Liquidation map updated with {len(levels)} levels ({len(self.liquidation_map)} buckets).")
+            except Exception as e:
+                logger.error(f"Error updating liquidation map: {e}")
+            await asyncio.sleep(LIQUIDATION_MAP_REFRESH)
+
+    def get_all_signals(self, current_btc_price: float) -> SignalSnapshot:
         """Aggregates all signals for the AI Brain."""
-        return MarketSignals(
+        liquidations = self.get_coinglass_liquidations()
+        liquidations.cluster_above = self.liquidation_map.nearest_above(current_btc_price, LIQUIDATION_CLUSTER_RANGE_PCT)
+        liquidations.cluster_below = self.liquidation_map.nearest_below(current_btc_price, LIQUIDATION_CLUSTER_RANGE_PCT)
+
+        return SignalSnapshot(
             timestamp=datetime.now(),
             btc_price=current_btc_price,
             order_book=self.get_order_book_walls(current_btc_price),
             funding=self.get_binance_funding_rate(),
-            liquidations=self.get_coinglass_liquidations()
+            liquidations=liquidations
         )
@@ -0,0 +1,253 @@
+import math
+import time
+from collections import deque
+from datetime import timezone
+from typing import List, Optional
+
+import numpy as np
+
+from helpers.logger import logger
+from helpers.constants import (
+    FAIR_VALUE_DEFAULT_VOL,
+    FAIR_VALUE_SAMPLE_INTERVAL,
+    FAIR_VALUE_VOL_WINDOW,
+    FAIR_VALUE_MIN_VOL_SAMPLES,
+    FAIR_VALUE_MAX_SAMPLE_GAP,
+    FAIR_VALUE_PRICE_HISTORY,
+    MARKET_WINDOW_SECONDS,
+    SECONDS_PER_YEAR
+)
+from models.internal import OddsSnapshot
+from models.polymarket import MarketInfo, FairValueQuote
+
+MIN_SECONDS_REMAINING = 1e-9
+CDF_EXACT_MAX_SIZE = 64
+SQRT_HALF = math.sqrt(0.5)
+
+_erf = np.frompyfunc(math.erf, 1, 1)
+
+def normal_cdf(x: np.ndarray) -> np.ndarray:
+    """
+    Vectorised standard normal CDF. Small arrays map the exact `math.erf` over elements
+    (cheaper than a dozen ufunc calls); larger ones use the Abramowitz & Stegun 7.1.26
+    erf approximation (|error| < 1.5e-7).
+    """
+    if x.size <= CDF_EXACT_MAX_SIZE:
+        return 0.5 * (1.0 + _erf(x * SQRT_HALF).astype(float))
+    z = np.abs(x) * SQRT_HALF
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+def market_expiry(market: MarketInfo) -> float:
+    """Market end time as a UTC epoch timestamp (NaN if unknown)."""
+    if not market.end_time:
+        return np.nan
+    end_time = market.end_time if market.end_time.tzinfo else market.end_time.replace(tzinfo=timezone.utc)
+    return end_time.timestamp()
+
+class RealizedVolatility:
+    """
+    Rolling realised volatility from mid-price samples taken every `sample_interval` seconds.
+    Keeps running sums of squared log returns and elapsed time, so each update is O(1).
+    """
+
+    def __init__(self, sample_interval: float = FAIR_VALUE_SAMPLE_INTERVAL, window: int = FAIR_VALUE_VOL_WINDOW,
+                 min_samples: int = FAIR_VALUE_MIN_VOL_SAMPLES, max_gap: float = FAIR_VALUE_MAX_SAMPLE_GAP,
+                 default_vol: float = FAIR_VALUE_DEFAULT_VOL):
+        self.sample_interval = sample_interval
+        self.min_samples = min_samples
+        self.max_gap = max_gap
+        self.default_vol = default_vol
+        self.returns = deque(maxlen=window)  # (squared log return, seconds elapsed)
+        self.sum_sq = 0.0
+        self.sum_dt = 0.0
+        self.last_price: Optional[float] = None
+        self.last_ts: Optional[float] = None
+
+    def update(self, price: float, ts: float) -> bool:
+        """Records a sample if one is due. Returns True when a sample was taken."""
+        if self.last_ts is not None and ts - self.last_ts < self.sample_interval:
+            return False
+        if self.last_ts is not None and ts - self.last_ts <= self.max_gap:
+            if len(self.returns) == self.returns.maxlen:
+                old_sq, old_dt = self.returns[0]
+                self.sum_sq -= old_sq
+                self.sum_dt -= old_dt
+            sq = math.log(price / self.last_price) ** 2
+            dt = ts - self.last_ts
+            self.returns.append((sq, dt))
+            self.sum_sq += sq
+            self.sum_dt += dt
+        self.last_price = price
+        self.last_ts = ts
+        return True
+
+    @property
+    def samples(self) -> int:
+        return len(self.returns)
+
+    def annualized(self) -> float:
+        if self.samples < self.min_samples or self.sum_dt <= 0:
+            return self.default_vol
+        return math.sqrt(max(self.sum_sq, 0.0) / self.sum_dt * SECONDS_PER_YEAR)
+
+class FairValueEngine:
+    """
+    Prices the Up/Down tokens of every tracked market as P(BTC closes above strike)
+    under a lognormal model with live realised volatility.
+
+    Market parameters are held in numpy arrays, so each book update reprices all markets
+    in one vectorised pass. Hook `on_book_update` into DataStreamer as a book listener.
+    Markets without a dollar strike ("Up or Down" windows) take the spot price at the
+    window open, which is written back to `MarketInfo.strike` once known.
+    """
+
+    def __init__(self, vol: RealizedVolatility = None, window_seconds: float = MARKET_WINDOW_SECONDS,
+                 price_history: int = FAIR_VALUE_PRICE_HISTORY):
+        self.vol = vol or RealizedVolatility()
+        self.window_seconds = window_seconds
+        self.price_history = deque(maxlen=price_history)  # (ts, mid) at the sampling cadence
+
+        self.markets: List[MarketInfo] = []
+        self._index = {}
+        self._strikes = np.empty(0)
+        self._log_strikes = np.empty(0)
+        self._expiries = np.empty(0)
+        self._market_prices = np.empty((2, 0))  # Rows: UP, DOWN
+        self._pending_strikes: List[int] = []
+
+        self.spot: Optional[float] = None
+        self.updated_at: Optional[float] = None
+        self.fair_up = np.empty(0)
+        self.seconds_remaining = np.empty(0)
+        self.recomputes = 0
+        self._total_us = 0.0
+        self._max_us = 0.0
+
+    def set_markets(self, markets: List[MarketInfo]):
+        """
+        Replaces the tracked markets. Catalog token prices win; the previously known price
+        is kept only for tokens the catalog returned no price for.
+        """
+        previous = {cid: (self._market_prices[0, i], self._market_prices[1, i]) for cid, i in self._index.items()}
+        self.markets = list(markets)
+        self._index = {m.condition_id: i for i, m in enumerate(self.markets)}
+
+        self._strikes = np.array([m.strike if m.strike else np.nan for m in self.markets], dtype=float)
+        self._log_strikes = np.log(self._strikes)
+        self._expiries = np.array([market_expiry(m) for m in self.markets], dtype=float)
+        self._market_prices = np.full((2, len(self.markets)), np.nan)
+        for i, m in enumerate(self.markets):
+            prev_up, prev_down = previous.get(m.condition_id, (np.nan, np.nan))
+            self._market_prices[0, i] = prev_up if m.yes_price is None else m.yes_price
+            self._market_prices[1, i] = prev_down if m.no_price is None else m.no_price
+        self._pending_strikes = [i for i, m in enumerate(self.markets) if not m.strike and m.end_time]
+
+        self.fair_up = np.full(len(self.markets), np.nan)
+        self.seconds_remaining = np.full(len(self.markets), np.nan)
+        self._resolve_pending_strikes(time.time())
+        if self.spot:
+            self.recompute(time.time())
+
+    def update_odds(self, condition_id: str, odds: OddsSnapshot):
+        """Records the latest market prices for one market."""
+        i = self._index.get(condition_id)
+        if i is not None:
+            self._market_prices[0, i] = odds.yes_price
+            self._market_prices[1, i] = odds.no_price
+
+    def on_book_update(self, mid: float, ts: float):
+        """Book listener: feeds the volatility estimator and reprices every market."""
+        if self.vol.update(mid, ts):
+            self.price_history.append((ts, mid))
+            if self._pending_strikes:
+                self._resolve_pending_strikes(ts)
+        self.spot = mid
+        self.recompute(ts)
+
+    def _price_at(self, ts: float) -> Optional[float]:
+        """First sampled price at or after `ts`, if the history covers that moment."""
+        if not self.price_history or self.price_history[0][0] > ts + self.vol.sample_interval:
+            return None
+        for sample_ts, price in self.price_history:
+            if sample_ts >= ts:
+                return price
+        return None
+
+    def _resolve_pending_strikes(self, now: float):
+        still_pending = []
+        for i in self._pending_strikes:
+            window_open = self._expiries[i] - self.window_seconds
+            strike = self._price_at(window_open) if now >= window_open else None
+            if strike is None:
+                if now < self._expiries[i]:
+                    still_pending.append(i)
+                continue
+            self._strikes[i] = strike
+            self._log_strikes[i] = math.log(strike)
+            self.markets[i].strike = strike
+            logger.info(f"Captured window-open strike ${strike:,.2f} for {self.markets[i].question}")
+        self._pending_strikes = still_pending
+
+    def recompute(self, now: float):
+        """One vectorised pass over all tracked markets."""
+        if self.spot is None or not self.markets:
+            return
+        started = time.perf_counter()
+
+        # Expired windows get a vanishing sigma, which drives the CDF to 0/1 without branching.
+        # Unknown strikes or expiries are NaN and propagate to NaN fair values.
+        remaining = np.maximum(self._expiries - now, MIN_SECONDS_REMAINING)
+        sigma = self.vol.annualized() * np.sqrt(remaining * (1.0 / SECONDS_PER_YEAR))
+        d2 = (math.log(self.spot) - self._log_strikes) / sigma - 0.5 * sigma
+        self.fair_up = normal_cdf(d2)
+        self.seconds_remaining = remaining
+        self.updated_at = now
+
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        self.recomputes += 1
+        self._total_us += elapsed_us
+        self._max_us = max(self._max_us, elapsed_us)
+
+    def quote(self, condition_id: str) -> Optional[FairValueQuote]:
+        i = self._index.get(condition_id)
+        return self._quote(i) if i is not None else None
+
+    def quotes(self) -> List[FairValueQuote]:
+        return [self._quote(i) for i in range(len(self.markets))]
+
+    def _quote(self, i: int) -> FairValueQuote:
+        def value(x):
+            return None if x is None or np.isnan(x) else round(float(x), 6)
+
+        fair_up = self.fair_up[i] if i < len(self.fair_up) else np.nan
+        fair_down = 1.0 - fair_up
+        up_price, down_price = self._market_prices[0, i], self._market_prices[1, i]
+        return FairValueQuote(
+            condition_id=self.markets[i].condition_id,
+            question=self.markets[i].question,
+            strike=value(self._strikes[i]),
+            seconds_remaining=value(self.seconds_remaining[i]) if i < len(self.seconds_remaining) else None,
+            fair_up=value(fair_up),
+            fair_down=value(fair_down),
+            up_price=value(up_price),
+            down_price=value(down_price),
+            up_edge=value(fair_up - up_price),
+            down_edge=value(fair_down - down_price)
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "spot": self.spot,
+            "annual_vol": round(self.vol.annualized(), 6),
+            "vol_samples": self.vol.samples,
+            "vol_is_default": self.vol.samples < self.vol.min_samples,
+            "markets": len(self.markets),
+            "pending_strikes": len(self._pending_strikes),
+            "recomputes": self.recomputes,
+            "avg_recompute_us": round(self._total_us / self.recomputes, 2) if self.recomputes else None,
+            "max_recompute_us": round(self._max_us, 2),
+            "updated_at": self.updated_at
+        }
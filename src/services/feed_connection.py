@@ -0,0 +1,168 @@
+import asyncio
+import random
+import time
+import websockets
+from typing import Callable, List, Optional
+
+from helpers.logger import logger
+from helpers.constants import (
+    FEED_MESSAGE_INTERVAL,
+    FEED_STALE_AFTER,
+    FEED_FAILOVER_LAG_FACTOR,
+    FEED_BACKOFF_BASE,
+    FEED_BACKOFF_MAX,
+    FEED_PING_INTERVAL,
+    FEED_PING_TIMEOUT
+)
+
+class FeedConnection:
+    """A single websocket connection with jittered backoff and message-gap tracking."""
+
+    def __init__(self, name: str, url: str, on_message: Callable[["FeedConnection", str], None], stale_after: float = FEED_STALE_AFTER):
+        self.name = name
+        self.url = url
+        self.stale_after = stale_after
+        self._on_message = on_message
+
+        self.connected = False
+        self.messages = 0
+        self.reconnects = 0
+        self.consecutive_failures = 0
+        self.last_message_at: Optional[float] = None
+        self.max_gap = 0.0
+        self.last_error: Optional[str] = None
+
+    def lag(self) -> float:
+        """Seconds since the last message on this connection (inf before the first one)."""
+        if self.last_message_at is None:
+            return float("inf")
+        return time.monotonic() - self.last_message_at
+
+    def is_stale(self) -> bool:
+        return not self.connected or self.lag() > self.stale_after
+
+    def backoff_delay(self) -> float:
+        """Exponential backoff with full jitter, so reconnect storms don't synchronise."""
+        cap = min(FEED_BACKOFF_MAX, FEED_BACKOFF_BASE * (2 ** self.consecutive_failures))
+        return random.uniform(0, cap)
+
+    async def run(self):
+        while True:
+            try:
+                async with websockets.connect(self.url, ping_interval=FEED_PING_INTERVAL, ping_timeout=FEED_PING_TIMEOUT) as websocket:
+                    self.connected = True
+                    self.consecutive_failures = 0
+                    logger.info(f"[{self.name}] Connected to {self.url}")
+                    while True:
+                        # A frozen stream never raises on its own, so every read is bounded.
+                        message = await asyncio.wait_for(websocket.recv(), timeout=self.stale_after)
+                        now = time.monotonic()
+                        if self.last_message_at is not None:
+                            self.max_gap = max(self.max_gap, now - self.last_message_at)
+                        self.last_message_at = now
+                        self.messages += 1
+                        self._on_message(self, message)
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                self.last_error = f"No message for {self.stale_after}s (stalled stream)"
+            except Exception as e:
+                self.last_error = str(e) or type(e).__name__
+            finally:
+                self.connected = False
+
+            self.consecutive_failures += 1
+            self.reconnects += 1
+            delay = self.backoff_delay()
+            logger.error(f"[{self.name}] Feed error: {self.last_error}. Reconnecting in {delay:.2f}s...")
+            await asyncio.sleep(delay)
+
+    def get_stats(self) -> dict:
+        lag = self.lag()
+        return {
+            "name": self.name,
+            "connected": self.connected,
+            "lag_ms": None if lag == float("inf") else round(lag * 1000, 1),
+            "max_gap_ms": round(self.max_gap * 1000, 1),
+            "messages": self.messages,
+            "reconnects": self.reconnects,
+            "last_error": self.last_error
+        }
+
+class FeedConnectionManager:
+    """
+    Runs a primary feed connection plus an optional hot standby on the same stream
+    (optionally through a different endpoint).
+    Only the active connection's messages are delivered; the standby is promoted when it
+    delivers a message while the active one has been silent for more than
+    `failover_lag_factor` message intervals, so ordinary jitter doesn't flap. When no connection has delivered for `stale_after` seconds,
+    `on_stale` is invoked once so the consumer can invalidate its state.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        on_message: Callable[[str], None],
+        on_stale: Callable[[], None],
+        hot_standby: bool = False,
+        standby_url: Optional[str] = None,
+        name: str = "feed",
+        message_interval: float = FEED_MESSAGE_INTERVAL,
+        stale_after: float = FEED_STALE_AFTER,
+        failover_lag_factor: float = FEED_FAILOVER_LAG_FACTOR
+    ):
+        self.message_interval = message_interval
+        self.failover_lag = failover_lag_factor * message_interval
+        self.stale_after = stale_after
+        self._on_message = on_message
+        self._on_stale = on_stale
+
+        self.connections: List[FeedConnection] = [FeedConnection(f"{name}-primary", url, self._handle, stale_after)]
+        if hot_standby:
+            self.connections.append(FeedConnection(f"{name}-standby", standby_url or url, self._handle, stale_after))
+        self.active = self.connections[0]
+
+        self.failovers = 0
+        self.is_stale = True
+        self.last_delivery_at = time.monotonic()
+
+    def _handle(self, connection: FeedConnection, message: str):
+        if connection is not self.active:
+            if not self.active.is_stale() and self.active.lag() <= self.failover_lag:
+                return
+            logger.warning(f"Failover: {self.active.name} lagging ({self.active.lag() * 1000:.0f}ms). Promoting {connection.name}.")
+            self.active = connection
+            self.failovers += 1
+
+        self.last_delivery_at = time.monotonic()
+        if self.is_stale:
+            logger.info(f"Feed live via {connection.name}.")
+            self.is_stale = False
+        self._on_message(message)
+
+    async def _monitor(self):
+        while True:
+            await asyncio.sleep(self.message_interval)
+            if not self.is_stale and time.monotonic() - self.last_delivery_at > self.stale_after:
+                self.is_stale = True
+                logger.warning(f"No feed data for {self.stale_after}s on any connection. Marking feed stale.")
+                self._on_stale()
+
+    async def run(self):
+        self.last_delivery_at = time.monotonic()
+        self.is_stale = False
+        tasks = [asyncio.create_task(c.run()) for c in self.connections]
+        tasks.append(asyncio.create_task(self._monitor()))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def get_stats(self) -> dict:
+        return {
+            "active": self.active.name,
+            "stale": self.is_stale,
+            "failovers": self.failovers,
+            "connections": [c.get_stats() for c in self.connections]
+        }
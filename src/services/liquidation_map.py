@@ -0,0 +1,119 @@
+import math
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from helpers.constants import LIQUIDATION_BUCKET_SIZE, LIQUIDATION_SIGNIFICANT_USD
+from models.market import LiquidationCluster
+
+def parse_liquidation_levels(payload: Any) -> List[Tuple[float, float]]:
+    """
+    Normalises a liquidation map payload into (price, volume_usd) pairs.
+    Accepts a `{"data": ...}` envelope around either a list of `[price, volume]` pairs,
+    a list of level objects (`price` + `volUsd`/`liqVolUsd`/`volume`) or a `{price: volume}` mapping.
+    """
+    if isinstance(payload, dict) and "data" in payload:
+        payload = payload["data"]
+
+    if isinstance(payload, dict):
+        return [(float(p), float(v)) for p, v in payload.items()]
+
+    levels = []
+    for level in payload or []:
+        if isinstance(level, dict):
+            volume = level.get("volUsd", level.get("liqVolUsd", level.get("volume", 0)))
+            levels.append((float(level["price"]), float(volume)))
+        else:
+            levels.append((float(level[0]), float(level[1])))
+    return levels
+
+class LiquidationMap:
+    """
+    Price-bucketed index of estimated liquidation volume.
+
+    Volumes live in a dict keyed by bucket number; bucket numbers whose volume reaches
+    `min_volume` are additionally kept in a sorted list, so "nearest significant cluster
+    above/below a price" is a single bisect (O(log n)) however many buckets exist.
+    """
+
+    def __init__(self, bucket_size: float = LIQUIDATION_BUCKET_SIZE, min_volume: float = LIQUIDATION_SIGNIFICANT_USD):
+        self.bucket_size = bucket_size
+        self.min_volume = min_volume
+        self._volumes: Dict[int, float] = {}
+        self._significant: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._volumes)
+
+    def _bucket(self, price: float) -> int:
+        return math.floor(price / self.bucket_size)
+
+    def _mid(self, bucket: int) -> float:
+        return (bucket + 0.5) * self.bucket_size
+
+    def _set(self, bucket: int, volume: float):
+        was_significant = self._volumes.get(bucket, 0.0) >= self.min_volume
+        is_significant = volume >= self.min_volume
+
+        if volume > 0:
+            self._volumes[bucket] = volume
+        else:
+            self._volumes.pop(bucket, None)
+
+        if is_significant and not was_significant:
+            insort(self._significant, bucket)
+        elif was_significant and not is_significant:
+            self._significant.pop(bisect_left(self._significant, bucket))
+
+    def update(self, levels: Iterable[Tuple[float, float]], replace: bool = False):
+        """
+        Applies a batch of (price, volume) levels. Levels sharing a bucket are summed and
+        replace that bucket's previous volume, so re-ingesting the same map is idempotent.
+        Buckets absent from the batch are left untouched, unless `replace` is set: a full
+        map fetch then clears them, so clusters that have disappeared drop out of the index.
+        """
+        batch: Dict[int, float] = {}
+        for price, volume in levels:
+            bucket = self._bucket(price)
+            batch[bucket] = batch.get(bucket, 0.0) + volume
+        if replace:
+            for bucket in [b for b in self._volumes if b not in batch]:
+                self._set(bucket, 0.0)
+        for bucket, volume in batch.items():
+            self._set(bucket, volume)
+
+    def clear(self):
+        self._volumes.clear()
+        self._significant.clear()
+
+    def to_levels(self) -> List[List[float]]:
+        """Bucket midpoints and volumes, for snapshots."""
+        return [[self._mid(b), v] for b, v in sorted(self._volumes.items())]
+
+    def _cluster(self, bucket: int, price: float) -> LiquidationCluster:
+        mid = self._mid(bucket)
+        return LiquidationCluster(
+            price=mid,
+            volume=self._volumes[bucket],
+            distance_pct=(mid - price) / price
+        )
+
+    def nearest_above(self, price: float, within_pct: float) -> Optional[LiquidationCluster]:
+        """Nearest significant cluster whose midpoint is above `price` and within `within_pct`."""
+        # Bucket midpoints exceed `price` exactly when bucket > price / size - 0.5
+        i = bisect_right(self._significant, price / self.bucket_size - 0.5)
+        if i == len(self._significant):
+            return None
+        bucket = self._significant[i]
+        if self._mid(bucket) > price * (1 + within_pct):
+            return None
+        return self._cluster(bucket, price)
+
+    def nearest_below(self, price: float, within_pct: float) -> Optional[LiquidationCluster]:
+        """Nearest significant cluster whose midpoint is below `price` and within `within_pct`."""
+        i = bisect_left(self._significant, price / self.bucket_size - 0.5) - 1
+        if i < 0:
+            return None
+        bucket = self._significant[i]
+        if self._mid(bucket) < price * (1 - within_pct):
+            return None
+        return self._cluster(bucket, price)
@@ -0,0 +1,146 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from helpers.logger import logger
+from helpers.constants import (
+    LOOP_MONITOR_INTERVAL,
+    LOOP_STALL_THRESHOLD,
+    LOOP_SAMPLE_INTERVAL,
+    LOOP_LAG_HISTORY,
+    LOOP_STALL_HISTORY,
+    LOOP_STACK_DEPTH
+)
+
+# Source module -> service a stall is attributed to. The innermost matching frame wins,
+# so a blocking trader call made from the engine is blamed on the trader.
+# A "*" module matches every module in that package.
+SERVICE_MODULES = {
+    ("services", "data_streamer"): "streamer",
+    ("services", "feed_connection"): "streamer",
+    ("services", "liquidation_map"): "liquidation_map",
+    ("services", "brain"): "brain",
+    ("services", "trader"): "trader",
+    ("services", "notification_service"): "notifier",
+    ("services", "trading_engine"): "engine",
+    ("services", "strategy_ensemble"): "ensemble",
+    ("services", "fair_value"): "fair_value",
+    ("services", "snapshot_service"): "snapshots",
+    ("strategies", "*"): "strategies",
+    ("api", "server"): "api",
+}
+
+class LoopMonitor:
+    """
+    Event-loop watchdog. A probe coroutine measures how late each sleep wakes up
+    (scheduling lag), while a daemon thread samples the loop thread's stack whenever
+    the probe has been starved for longer than the stall threshold.
+    """
+
+    def __init__(self, interval: float = LOOP_MONITOR_INTERVAL, stall_threshold: float = LOOP_STALL_THRESHOLD, sample_interval: float = LOOP_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.sample_interval = sample_interval
+
+        self.lags = deque(maxlen=LOOP_LAG_HISTORY)
+        self.stalls = deque(maxlen=LOOP_STALL_HISTORY)
+        self.stall_samples = Counter()
+
+        self._last_beat = time.monotonic()
+        self._current_stall: Optional[dict] = None
+        self._current_stall_beat: Optional[float] = None
+        self._current_stall_samples = Counter()
+        self._loop_thread_id: Optional[int] = None
+        self._watchdog: Optional[threading.Thread] = None
+
+    async def run(self):
+        """
+        Runs the lag probe on the current loop alongside the watchdog thread. The watchdog
+        stops with the probe; otherwise it would record the stopped probe as one endless stall.
+        """
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        stopped = threading.Event()
+        self._watchdog = threading.Thread(target=self._watch, args=(stopped,), name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Loop monitor started (stall threshold {self.stall_threshold * 1000:.0f}ms).")
+
+        try:
+            while True:
+                started = time.monotonic()
+                await asyncio.sleep(self.interval)
+                now = time.monotonic()
+                self.lags.append(max(0.0, now - started - self.interval))
+                self._last_beat = now
+        finally:
+            stopped.set()
+            self._current_stall = None
+
+    def _watch(self, stopped: threading.Event):
+        while not stopped.wait(self.sample_interval):
+            last_beat = self._last_beat
+            blocked_for = time.monotonic() - last_beat - self.interval
+            if blocked_for < self.stall_threshold:
+                self._current_stall = None
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            service = self._attribute(stack)
+            self.stall_samples[service] += 1
+
+            # One entry per stall: later samples of the same stall update it in place
+            if self._current_stall is None or self._current_stall_beat != last_beat:
+                self._current_stall_beat = last_beat
+                self._current_stall_samples = Counter()
+                self._current_stall = {"timestamp": datetime.now().isoformat()}
+                self.stalls.append(self._current_stall)
+            self._current_stall_samples[service] += 1
+            self._current_stall.update({
+                "blocked_ms": round(blocked_for * 1000, 1),
+                "service": self._current_stall_samples.most_common(1)[0][0],
+                "samples": sum(self._current_stall_samples.values()),
+                "stack": [line.rstrip() for line in traceback.format_list(stack[-LOOP_STACK_DEPTH:])]
+            })
+
+    @staticmethod
+    def _attribute(stack: List[traceback.FrameSummary]) -> str:
+        for frame in reversed(stack):
+            path = Path(frame.filename)
+            service = SERVICE_MODULES.get((path.parent.name, path.stem)) or SERVICE_MODULES.get((path.parent.name, "*"))
+            if service:
+                return service
+        return "other"
+
+    def get_stats(self) -> dict:
+        """Lag percentiles plus blocked time (estimated from stack samples) per service."""
+        lags = sorted(self.lags)
+        # Snapshot first: the watchdog thread keeps adding samples while we read.
+        blocked = sorted(dict(self.stall_samples).items(), key=lambda item: item[1], reverse=True)
+
+        def percentile(p: float):
+            if not lags:
+                return None
+            return round(lags[min(len(lags) - 1, int(p * len(lags)))] * 1000, 2)
+
+        return {
+            "samples": len(lags),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(lags[-1] * 1000, 2) if lags else None,
+            "stall_threshold_ms": self.stall_threshold * 1000,
+            "blocked_ms_by_service": {
+                service: round(count * self.sample_interval * 1000, 1)
+                for service, count in blocked
+            },
+            "recent_stalls": [dict(stall) for stall in list(self.stalls)[-5:]]
+        }
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from helpers.logger import logger
+from helpers.constants import (
+    SNAPSHOT_PATH,
+    SNAPSHOT_VERSION,
+    SNAPSHOT_INTERVAL,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_BOOK_MAX_AGE,
+    SNAPSHOT_MARKET_MAX_AGE,
+    SNAPSHOT_SIGNALS_MAX_AGE,
+    SNAPSHOT_LIQUIDATION_MAX_AGE
+)
+from models.market import MarketSignals
+from models.internal import BookLevel, SignalSnapshot, OddsSnapshot
+from models.polymarket import PolymarketOdds, MarketInfo
+
+class SnapshotService:
+    """
+    Periodically persists a compact snapshot of engine and streamer state (including the
+    liquidation map cache) so a restarted
+    bot can make decisions immediately instead of waiting for a full warm-up.
+    Serialisation and disk I/O run in a worker thread; writes are atomic (tmp + rename).
+    """
+
+    def __init__(self, path: str = SNAPSHOT_PATH, interval: float = SNAPSHOT_INTERVAL):
+        self.path = Path(path)
+        self.interval = interval
+        self.last_saved_at: Optional[float] = None
+
+    def capture(self, engine, streamer) -> dict:
+        """Collects the current state. Cheap enough to run on the event loop."""
+        book = None
+        if streamer.book_valid:
+            book = {
+                "updated_at": streamer.book_updated_at,
+                "bids": [[b.price, b.volume] for b in streamer.binance_depth_bids],
+                "asks": [[a.price, a.volume] for a in streamer.binance_depth_asks]
+            }
+
+        return {
+            "version": SNAPSHOT_VERSION,
+            "captured_at": time.time(),
+            "book": book,
+            "markets": [m.model_dump(mode="json") for m in engine.markets],
+            "market": engine.market.model_dump(mode="json") if engine.market else None,
+            "signals": engine.latest_signals.to_model().model_dump(mode="json") if engine.latest_signals else None,
+            "odds": engine.latest_odds.to_model().model_dump() if engine.latest_odds else None,
+            "brief": engine.latest_brief,
+            "liquidation_map": streamer.liquidation_map.to_levels(),
+            "history": list(engine.history)
+        }
+
+    def _write(self, snapshot: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _read(self) -> Optional[dict]:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    async def save(self, engine, streamer):
+        snapshot = self.capture(engine, streamer)
+        await asyncio.to_thread(self._write, snapshot)
+        self.last_saved_at = snapshot["captured_at"]
+
+    async def run(self, engine, streamer):
+        """Writes a snapshot every `interval` seconds, plus a final one on shutdown."""
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                try:
+                    await self.save(engine, streamer)
+                except Exception as e:
+                    logger.error(f"Snapshot write failed: {e}")
+        except asyncio.CancelledError:
+            try:
+                self._write(self.capture(engine, streamer))
+            except Exception as e:
+                logger.error(f"Final snapshot write failed: {e}")
+            raise
+
+    async def restore(self, engine, streamer) -> bool:
+        """Restores every section of the last snapshot that passes its freshness check."""
+        try:
+            snapshot = await asyncio.to_thread(self._read)
+        except Exception as e:
+            logger.error(f"Could not read snapshot {self.path}: {e}")
+            return False
+
+        if not snapshot or snapshot.get("version") != SNAPSHOT_VERSION:
+            return False
+
+        age = time.time() - snapshot.get("captured_at", 0)
+        if age > SNAPSHOT_MAX_AGE:
+            logger.info(f"Ignoring snapshot from {age:.0f}s ago (max {SNAPSHOT_MAX_AGE}s).")
+            return False
+
+        # Parse every section before touching any state, so a corrupt section cannot
+        # leave the engine half-restored.
+        book = markets = market = signals = odds = brief = levels = None
+        try:
+            book_section = snapshot.get("book")
+            if book_section and time.time() - book_section["updated_at"] <= SNAPSHOT_BOOK_MAX_AGE:
+                book = (
+                    [BookLevel(float(p), float(v)) for p, v in book_section["bids"]],
+                    [BookLevel(float(p), float(v)) for p, v in book_section["asks"]],
+                    float(book_section["updated_at"])
+                )
+
+            if age <= SNAPSHOT_MARKET_MAX_AGE:
+                markets = [MarketInfo.model_validate(m) for m in snapshot.get("markets", [])]
+                if snapshot.get("market"):
+                    market = MarketInfo.model_validate(snapshot["market"])
+
+            if age <= SNAPSHOT_SIGNALS_MAX_AGE:
+                if snapshot.get("signals"):
+                    signals = SignalSnapshot.from_model(MarketSignals.model_validate(snapshot["signals"]))
+                if snapshot.get("odds"):
+                    odds = OddsSnapshot.from_model(PolymarketOdds.model_validate(snapshot["odds"]))
+                if snapshot.get("brief"):
+                    # Nothing is waiting on a restored brief; flag it so API clients know.
+                    brief = dict(snapshot["brief"], restored=True)
+
+            if age <= SNAPSHOT_LIQUIDATION_MAX_AGE and snapshot.get("liquidation_map"):
+                levels = [(float(p), float(v)) for p, v in snapshot["liquidation_map"]]
+
+            history = list(snapshot.get("history", []))
+        except Exception as e:
+            logger.error(f"Snapshot restore aborted (corrupt or incompatible): {e}")
+            return False
+
+        restored = []
+        if book:
+            streamer.restore_book(*book)
+            restored.append("book")
+        if markets is not None:
+            engine.markets = markets
+            if market:
+                engine.market = market
+            restored.append("markets")
+        if age <= SNAPSHOT_SIGNALS_MAX_AGE:
+            if signals:
+                engine.latest_signals = signals
+            if odds:
+                engine.latest_odds = odds
+            if brief:
+                engine.latest_brief = brief
+            restored.append("signals")
+        if levels:
+            streamer.liquidation_map.update(levels)
+            restored.append("liquidation map")
+        engine.history.extend(history)
+        restored.append("history")
+
+        logger.info(f"Warm restart from snapshot ({age:.1f}s old): restored {', '.join(restored)}.")
+        return True
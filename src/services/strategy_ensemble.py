@@ -0,0 +1,149 @@
+import asyncio
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from helpers.logger import logger
+from helpers.constants import STRATEGY_AGGREGATION, STRATEGY_WEIGHTS, STRATEGY_PROCESS_WORKERS, STRATEGY_THREAD_WORKERS
+from models.ai import AIDecision
+from models.internal import SignalSnapshot, OddsSnapshot
+from models.polymarket import MarketInfo
+from models.strategy import SignalFeatures, StrategyResult
+from strategies.base import Strategy, compute_features
+
+class StrategyEnsemble:
+    """
+    Runs several strategies concurrently on the same signal snapshot and aggregates them.
+
+    Aggregation modes:
+      - "escalate": run the cheap strategies; if they agree, that is the decision,
+        otherwise consult the expensive ones (Claude) and follow them.
+      - "vote": run everything and take a confidence-weighted vote (STRATEGY_WEIGHTS).
+    """
+
+    def __init__(self, strategies: List[Strategy], aggregation: str = STRATEGY_AGGREGATION, weights: Dict[str, float] = None):
+        if aggregation not in ("escalate", "vote"):
+            raise ValueError(f"Unknown aggregation mode: {aggregation}")
+        self.strategies = strategies
+        self.aggregation = aggregation
+        self.weights = weights or STRATEGY_WEIGHTS
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+        self.latest_results: List[StrategyResult] = []
+        self.latest_decision: Optional[AIDecision] = None
+        self.escalations = 0
+        self.decisions = 0
+        self._stats = defaultdict(lambda: {"runs": 0, "total_ms": 0.0, "max_ms": 0.0, "actions": defaultdict(int)})
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if not self._process_pool:
+            self._process_pool = ProcessPoolExecutor(max_workers=STRATEGY_PROCESS_WORKERS)
+        return self._process_pool
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        # Blocking strategies get their own threads so they can't be starved by (or starve)
+        # other users of the loop's default executor.
+        if not self._thread_pool:
+            self._thread_pool = ThreadPoolExecutor(max_workers=STRATEGY_THREAD_WORKERS, thread_name_prefix="strategy")
+        return self._thread_pool
+
+    async def _run(self, strategy: Strategy, features: SignalFeatures, signals: SignalSnapshot, odds: OddsSnapshot) -> StrategyResult:
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            if strategy.cpu_bound:
+                decision = await loop.run_in_executor(self._get_process_pool(), strategy.evaluate, features, signals, odds)
+            elif strategy.blocking:
+                decision = await loop.run_in_executor(self._get_thread_pool(), strategy.evaluate, features, signals, odds)
+            else:
+                decision = strategy.evaluate(features, signals, odds)
+        except Exception as e:
+            logger.error(f"Strategy {strategy.name} failed: {e}")
+            decision = AIDecision(action="WAIT", confidence=0.0, reasoning=f"Error: {str(e)}")
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        stats = self._stats[strategy.name]
+        stats["runs"] += 1
+        stats["total_ms"] += latency_ms
+        stats["max_ms"] = max(stats["max_ms"], latency_ms)
+        stats["actions"][decision.action] += 1
+
+        return StrategyResult(
+            name=strategy.name,
+            action=decision.action,
+            confidence=decision.confidence,
+            reasoning=decision.reasoning,
+            latency_ms=round(latency_ms, 3)
+        )
+
+    async def _run_all(self, strategies: List[Strategy], features: SignalFeatures, signals: SignalSnapshot, odds: OddsSnapshot) -> List[StrategyResult]:
+        return list(await asyncio.gather(*(self._run(s, features, signals, odds) for s in strategies)))
+
+    def _vote(self, results: List[StrategyResult]) -> AIDecision:
+        """Confidence-weighted vote; confidence is the winner's share of the total weight."""
+        scores: Dict[str, float] = defaultdict(float)
+        total_weight = 0.0
+        for r in results:
+            weight = self.weights.get(r.name, 1.0)
+            scores[r.action] += weight * r.confidence
+            total_weight += weight
+
+        action = max(scores, key=scores.get) if scores else "WAIT"
+        confidence = scores[action] / total_weight if total_weight else 0.0
+        return AIDecision(action=action, confidence=confidence, reasoning=self._combined_reasoning(results))
+
+    @staticmethod
+    def _combined_reasoning(results: List[StrategyResult]) -> str:
+        return "\n".join(f"[{r.name}] {r.action} ({r.confidence:.2f}): {r.reasoning}" for r in results)
+
+    async def decide(self, signals: SignalSnapshot, odds: OddsSnapshot, market: Optional[MarketInfo]) -> AIDecision:
+        features = compute_features(signals, odds, market)
+        cheap = [s for s in self.strategies if not s.expensive]
+        expensive = [s for s in self.strategies if s.expensive]
+
+        if self.aggregation == "vote":
+            results = await self._run_all(self.strategies, features, signals, odds)
+            decision = self._vote(results)
+        else:
+            results = await self._run_all(cheap, features, signals, odds)
+            if results and len({r.action for r in results}) == 1 or not expensive:
+                decision = self._vote(results)
+            else:
+                self.escalations += 1
+                escalated = await self._run_all(expensive, features, signals, odds)
+                results += escalated
+                decision = self._vote(escalated)
+                decision.reasoning = self._combined_reasoning(results)
+
+        self.decisions += 1
+        self.latest_results = results
+        self.latest_decision = decision
+        logger.info(f"Ensemble Decision: {decision.action} (Conf: {decision.confidence:.2f}) from {', '.join(f'{r.name}={r.action}' for r in results)}")
+        return decision
+
+    def get_stats(self) -> dict:
+        return {
+            "aggregation": self.aggregation,
+            "decisions": self.decisions,
+            "escalations": self.escalations,
+            "strategies": {
+                name: {
+                    "runs": s["runs"],
+                    "avg_ms": round(s["total_ms"] / s["runs"], 3) if s["runs"] else None,
+                    "max_ms": round(s["max_ms"], 3),
+                    "actions": dict(s["actions"])
+                }
+                for name, s in self._stats.items()
+            },
+            "latest": [r.model_dump() for r in self.latest_results]
+        }
+
+    def shutdown(self):
+        """Releases the worker pools. Called on app teardown; pools are recreated if used again."""
+        for pool in (self._process_pool, self._thread_pool):
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._process_pool = None
+        self._thread_pool = None
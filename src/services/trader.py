@@ -1,16 +1,37 @@
 import json
-from typing import List
+import re
+import requests
+from datetime import datetime
+from typing import List, Optional
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs
 from py_clob_client.constants import POLYGON
 
 from helpers.logger import logger
-from helpers.constants import TAKER_FEE, BTC_MARKET_QUESTION_FILTER, TIME_FRAME_FILTER
-from models.polymarket import PolymarketOdds, MarketInfo, ClobMarket
+from helpers.constants import TAKER_FEE, BTC_MARKET_QUESTION_FILTER, TIME_FRAME_FILTER, CLOB_MARKETS_PATH, CLOB_HTTP_TIMEOUT
+from helpers.decoding import decoder
+from models.polymarket import MarketInfo, ClobMarket
+from models.internal import OddsSnapshot
+
+STRIKE_PATTERN = re.compile(r"\$([\d,]+(?:\.\d+)?)")
+
+def parse_strike(question: str) -> Optional[float]:
+    """Extracts the dollar strike from questions like 'Will Bitcoin be above $64,500 at 3:15PM ET?'."""
+    match = STRIKE_PATTERN.search(question)
+    return float(match.group(1).replace(",", "")) if match else None
+
+def parse_end_time(end_date_iso: Optional[str]) -> Optional[datetime]:
+    if not end_date_iso:
+        return None
+    try:
+        return datetime.fromisoformat(end_date_iso.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
 class PolymarketTrader:
     def __init__(self, private_key: str = None, api_key: str = None, secret: str = None, passphrase: str = None, host: str = "https://clob.polymarket.com"):
         self.is_public_only = not all([private_key, api_key, secret, passphrase])
+        self.host = host
         
         if self.is_public_only:
             logger.info("Initializing PolymarketTrader in PUBLIC-ONLY mode (No API keys provided).")
@@ -32,85 +53,98 @@ class PolymarketTrader:
         try:
             # Polymarket API returns a lot of old markets. We need to find the CURRENT ones.
             # We fetch a large batch and filter deeply.
-            resp = self.client.get_markets()
-            
-            if isinstance(resp, dict):
-                raw_markets = resp.get("data", [])
-            elif isinstance(resp, list):
-                raw_markets = resp
-            else:
-                return []
-
-            # Parse with Pydantic for validation and easier access
-            markets: List[ClobMarket] = []
-            for m in raw_markets:
-                try:
-                    markets.append(ClobMarket(**m))
-                except Exception as e:
-                    # Skip malformed markets but log if it's a major issue
-                    logger.debug(f"Skipping malformed market data: {e}")
+            # Fetched raw (public endpoint) so only the fields we filter on get decoded.
+            resp = requests.get(f"{self.host}{CLOB_MARKETS_PATH}", timeout=CLOB_HTTP_TIMEOUT)
+            resp.raise_for_status()
+            raw_markets = decoder.decode_markets(resp.content)
+
+            return self.filter_btc_markets(raw_markets)
+        except Exception as e:
+            logger.error(f"Market search error: {e}")
+            return []
+
+    @staticmethod
+    def filter_btc_markets(raw_markets: List[dict]) -> List[MarketInfo]:
+        """
+        Filters a raw CLOB markets payload down to open BTC 15-minute markets.
+        Works on the raw dicts; only the handful of matches are validated with Pydantic.
+        """
+        btc_15m_markets = []
+        
+        # Filter for markets that are actually open for business
+        open_markets = [
+            m for m in raw_markets
+            if isinstance(m, dict) and m.get("active") and not m.get("closed") and m.get("accepting_orders")
+        ]
+        active_count = len(open_markets)
+        
+        logger.info(f"Retrieved {len(raw_markets)} total markets. Found {active_count} currently active/open markets.")
+
+        for raw in open_markets:
+            question = raw.get("question") or raw.get("title") or ""
             
-            btc_15m_markets = []
-            active_count = 0
+            # BTC 15-minute markets are usually named "Bitcoin Price at [Time]" or "Will Bitcoin be above..."
+            # High frequency markets often have "15-minute" or specific time formats.
+            question_lower = question.lower()
+            is_btc = "bitcoin" in question_lower or "btc" in question_lower
             
-            # Filter for markets that are actually open for business
-            open_markets = [m for m in markets if m.active and not m.closed and m.accepting_orders]
-            active_count = len(open_markets)
+            # Check for 15m or the "at X:XX" pattern which is standard for price markets
+            is_15m = any(x in question_lower for x in ["15-minute", "15 min", "15m", "bitcoin price at"])
             
-            logger.info(f"Retrieved {len(markets)} total markets. Found {active_count} currently active/open markets.")
-
-            for m in open_markets:
-                question = m.question or m.title or ""
-                
-                # BTC 15-minute markets are usually named "Bitcoin Price at [Time]" or "Will Bitcoin be above..."
-                # High frequency markets often have "15-minute" or specific time formats.
-                question_lower = question.lower()
-                is_btc = "bitcoin" in question_lower or "btc" in question_lower
-                
-                # Check for 15m or the "at X:XX" pattern which is standard for price markets
-                is_15m = any(x in question_lower for x in ["15-minute", "15 min", "15m", "bitcoin price at"])
-                
-                if is_btc and is_15m:
-                    logger.info(f"MATCH FOUND: {question}")
-                    
-                    # Extract tokens. Key can be 'tokens' (list) or 'clobTokenIds'
-                    if m.tokens and len(m.tokens) >= 2:
-                        btc_15m_markets.append(MarketInfo(
-                            condition_id=m.conditionId,
-                            question=question,
-                            yes_token=m.tokens[0].token_id,
-                            no_token=m.tokens[1].token_id,
-                            active=True
-                        ))
-                    elif m.clobTokenIds and len(m.clobTokenIds) >= 2:
-                        btc_15m_markets.append(MarketInfo(
-                            condition_id=m.conditionId,
-                            question=question,
-                            yes_token=m.clobTokenIds[0],
-                            no_token=m.clobTokenIds[1],
-                            active=True
-                        ))
+            if not (is_btc and is_15m):
+                continue
+
+            try:
+                m = ClobMarket(**raw)
+            except Exception as e:
+                # Skip malformed markets but log if it's a major issue
+                logger.debug(f"Skipping malformed market data: {e}")
+                continue
+
+            logger.info(f"MATCH FOUND: {question}")
             
-            if not btc_15m_markets and active_count > 0:
-                # Log what we ARE finding to help narrow it down
-                current_btc_samples = [m.question for m in open_markets if "btc" in (m.question or "").lower() or "bitcoin" in (m.question or "").lower()][:5]
-                logger.warning(f"No 15m BTC markets in the {active_count} active markets. Samples: {current_btc_samples}")
+            # Extract tokens. Key can be 'tokens' (list) or 'clobTokenIds'
+            yes_price = no_price = None
+            if m.tokens and len(m.tokens) >= 2:
+                yes_token, no_token = m.tokens[0].token_id, m.tokens[1].token_id
+                yes_price, no_price = m.tokens[0].price, m.tokens[1].price
+            elif m.clobTokenIds and len(m.clobTokenIds) >= 2:
+                yes_token, no_token = m.clobTokenIds[0], m.clobTokenIds[1]
+            else:
+                continue
 
-            return btc_15m_markets
-        except Exception as e:
-            logger.error(f"Market search error: {e}")
-            return []
+            btc_15m_markets.append(MarketInfo(
+                condition_id=m.conditionId,
+                question=question,
+                yes_token=yes_token,
+                no_token=no_token,
+                active=True,
+                strike=parse_strike(question),
+                end_time=parse_end_time(m.end_date_iso),
+                yes_price=yes_price,
+                no_price=no_price
+            ))
+        
+        if not btc_15m_markets and active_count > 0:
+            # Log what we ARE finding to help narrow it down
+            current_btc_samples = [
+                m.get("question") for m in open_markets
+                if "btc" in (m.get("question") or "").lower() or "bitcoin" in (m.get("question") or "").lower()
+            ][:5]
+            logger.warning(f"No 15m BTC markets in the {active_count} active markets. Samples: {current_btc_samples}")
+
+        return btc_15m_markets
 
-    def get_market_odds(self, yes_token_id: str) -> PolymarketOdds:
+    def get_market_odds(self, yes_token_id: str) -> OddsSnapshot:
         """Fetches current YES/NO prices for a specific market."""
         try:
-            orderbook = self.client.get_orderbook(yes_token_id)
+            orderbook = self.client.get_order_book(yes_token_id)
             yes_price = float(orderbook.bids[0].price) if orderbook.bids else 0.5
             no_price = 1.0 - yes_price 
-            return PolymarketOdds(yes_price=yes_price, no_price=no_price)
+            return OddsSnapshot(yes_price=yes_price, no_price=no_price)
         except Exception as e:
             logger.error(f"Error fetching odds for {yes_token_id}: {e}")
-            return PolymarketOdds(yes_price=0.5, no_price=0.5)
+            return OddsSnapshot(yes_price=0.5, no_price=0.5)
 
     def execute_trade(self, token_id: str, amount_usdc: float, price_limit: float):
         """Dry Run mode: Logs what would have been executed but sends no transactions."""
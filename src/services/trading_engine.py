@@ -1,34 +1,109 @@
 import asyncio
+import sys
+import threading
+import time
+from collections import deque
+from typing import List, Optional
 from helpers.logger import logger
 from helpers.service_locator import service_locator
-from helpers.constants import AI_CONFIDENCE_THRESHOLD, DEFAULT_TRADE_AMOUNT
+from helpers.constants import (
+    AI_CONFIDENCE_THRESHOLD,
+    DEFAULT_TRADE_AMOUNT,
+    SIGNAL_HISTORY_SIZE,
+    ENGINE_TICK_INTERVAL,
+    TICK_LATENCY_HISTORY,
+    FAIR_VALUE_MARKET_REFRESH
+)
 from services.data_streamer import DataStreamer
 from services.brain import Brain
 from services.trader import PolymarketTrader
 from services.notification_service import NotificationService
+from services.snapshot_service import SnapshotService
+from services.strategy_ensemble import StrategyEnsemble
+from services.fair_value import FairValueEngine, market_expiry
 from models.polymarket import MarketInfo
+from models.internal import SignalSnapshot, OddsSnapshot
 from models.ai import AIDecision
 
 class TradingEngine:
-    def __init__(self):
+    def __init__(self, tick_interval: float = ENGINE_TICK_INTERVAL):
+        self.tick_interval = tick_interval
         self.streamer: DataStreamer = None
         self.brain: Brain = None
         self.trader: PolymarketTrader = None
         self.market: MarketInfo = None
+        self.markets: List[MarketInfo] = []
         
         # State exposure for API
-        self.latest_signals = None
-        self.latest_odds = None
+        self.latest_signals: Optional[SignalSnapshot] = None
+        self.latest_odds: Optional[OddsSnapshot] = None
         self.latest_brief = None
+        self.history = deque(maxlen=SIGNAL_HISTORY_SIZE)
         self.confirmation_queue = asyncio.Queue()
+        self.terminal_queue = asyncio.Queue()
+        self._terminal_reader: Optional[threading.Thread] = None
+
+        # Instrumentation (signals -> decision latency, in ms)
+        self.tick_latencies = deque(maxlen=TICK_LATENCY_HISTORY)
+        self.ticks = 0
+        self.last_tick_at: Optional[float] = None
+        self.briefs_presented = 0
 
     def _resolve_dependencies(self):
         self.streamer = service_locator.get(DataStreamer)
         self.brain = service_locator.get(Brain)
         self.trader = service_locator.get(PolymarketTrader)
         self.notifier = service_locator.get(NotificationService)
+        self.snapshots = service_locator.get(SnapshotService)
+        self.ensemble = service_locator.get(StrategyEnsemble)
+        self.fair_value = service_locator.get(FairValueEngine)
+
+    def _start_terminal_reader(self):
+        """
+        Reads terminal lines on one long-lived daemon thread and hands them to the loop.
+        A per-brief `to_thread(input)` would leave a default-executor worker blocked on
+        stdin whenever the brief is answered through the API instead.
+        """
+        if self._terminal_reader:
+            return
+        loop = asyncio.get_running_loop()
+
+        def read_lines():
+            for line in sys.stdin:
+                loop.call_soon_threadsafe(self.terminal_queue.put_nowait, line)
+
+        self._terminal_reader = threading.Thread(target=read_lines, name="terminal-reader", daemon=True)
+        self._terminal_reader.start()
+
+    def _set_markets(self, markets: List[MarketInfo]):
+        """Replaces the tracked markets, carrying over captured strikes and moving off expired windows."""
+        captured = {m.condition_id: m.strike for m in self.markets if m.strike}
+        for m in markets:
+            if not m.strike and m.condition_id in captured:
+                m.strike = captured[m.condition_id]
+        self.markets = markets
+        self.fair_value.set_markets(markets)
+
+        now = time.time()
+        live = [m for m in markets if not market_expiry(m) <= now]  # Unknown (NaN) expiry counts as live
+        current = self.market.condition_id if self.market else None
+        self.market = next((m for m in live if m.condition_id == current), live[0] if live else None)
+
+    async def refresh_markets(self):
+        """Periodically refreshes the market catalog, since 15-minute windows keep expiring."""
+        while True:
+            await asyncio.sleep(FAIR_VALUE_MARKET_REFRESH)
+            try:
+                markets = await asyncio.to_thread(self.trader.find_active_btc_markets)
+                if markets:
+                    previous = self.market
+                    self._set_markets(markets)
+                    if self.market and (not previous or self.market.condition_id != previous.condition_id):
+                        logger.info(f"Switched to market: {self.market.question}")
+            except Exception as e:
+                logger.error(f"Market refresh error: {e}")
 
-    def _generate_trade_brief(self, decision: AIDecision, signals, odds, fee):
+    def _generate_trade_brief(self, decision: AIDecision, signals, odds, fee, fair=None):
         """Prints a structured Trade Brief to the terminal."""
         print("\n" + "="*60)
         print(" 🎯 SIGNAL SNIPER: TRADE BRIEF")
@@ -48,10 +123,19 @@ class TradingEngine:
         print(f"  Funding Rate: {signals.funding.current_funding_rate * 100:.4f}%")
         print(f"  Short Liqs (1h): ${signals.liquidations.short_vol:,.0f}")
         print(f"  Long Liqs (1h): ${signals.liquidations.long_vol:,.0f}")
+        for label, cluster in (("above", signals.liquidations.cluster_above), ("below", signals.liquidations.cluster_below)):
+            if cluster:
+                print(f"  Nearest Cluster {label}: ${cluster.price:,.0f} ({cluster.distance_pct * 100:+.2f}%) | ${cluster.volume:,.0f}")
 
         print(f"\n[Polymarket Odds]")
         print(f"  YES Price: ${odds.yes_price:.2f} | NO Price: ${odds.no_price:.2f}")
 
+        if fair and fair.fair_up is not None:
+            print(f"\n[Fair Value]")
+            print(f"  Strike: ${fair.strike:,.2f} | Time Left: {fair.seconds_remaining:.0f}s | Vol: {self.fair_value.vol.annualized():.1%}")
+            print(f"  UP Fair: ${fair.fair_up:.3f} | Edge: {fair.up_edge:+.3f}")
+            print(f"  DOWN Fair: ${fair.fair_down:.3f} | Edge: {fair.down_edge:+.3f}")
+
         print(f"\n[Fee Architecture 2026]")
         print(f"  Estimated Taker Fee: {fee * 100:.2f}%")
         if fee > 0.008:
@@ -65,46 +149,71 @@ class TradingEngine:
         """Starts the core trading workflow."""
         self._resolve_dependencies()
         logger.info("Signal Sniper Agent started. Initializing data streams...")
+
+        # Warm restart: restore whatever state is still fresh before touching the network
+        await self.snapshots.restore(self, self.streamer)
         
         # Start background tasks
+        self._start_terminal_reader()
+        self.streamer.add_book_listener(self.fair_value.on_book_update)
         asyncio.create_task(self.streamer.start_binance_websocket())
+        asyncio.create_task(self.streamer.start_liquidation_map_updates())
+        asyncio.create_task(self.snapshots.run(self, self.streamer))
+        asyncio.create_task(self.refresh_markets())
 
         # Initial Market Discovery
-        logger.info("Discovering active BTC 15-minute markets...")
-        btc_markets = self.trader.find_active_btc_markets()
-        self.market = btc_markets[0] if btc_markets else None
-        
         if self.market:
-            logger.info(f"Connected to market: {self.market.question}")
+            logger.info(f"Resuming restored market: {self.market.question}")
+            self._set_markets(self.markets or [self.market])
         else:
-            logger.warning("No active BTC 15-minute markets found. Will retry in loop.")
+            logger.info("Discovering active BTC 15-minute markets...")
+            self._set_markets(self.trader.find_active_btc_markets())
+            
+            if self.market:
+                logger.info(f"Connected to market: {self.market.question}")
+            else:
+                logger.warning("No active BTC 15-minute markets found. Will retry in loop.")
 
         # Trading Loop
         while True:
             try:
                 if not self.market:
-                    btc_markets = self.trader.find_active_btc_markets()
-                    if btc_markets:
-                        self.market = btc_markets[0]
+                    self._set_markets(self.trader.find_active_btc_markets())
+                    if self.market:
                         logger.info(f"Market found: {self.market.question}")
                     else:
                         await asyncio.sleep(60)
                         continue
 
-                if not self.streamer.binance_depth_bids:
-                    logger.warning("Waiting for Binance depth data...")
+                if not self.streamer.book_valid or not self.streamer.binance_depth_bids:
+                    logger.warning("Waiting for fresh Binance depth data...")
                     await asyncio.sleep(5)
                     continue
                     
+                # The market refresh task may switch self.market while this tick awaits (e.g. the
+                # confirmation prompt); odds, notification and execution must all use one market.
+                market = self.market
+                tick_started = time.perf_counter()
                 current_btc_price = self.streamer.binance_depth_bids[0].price
                 signals = self.streamer.get_all_signals(current_btc_price)
-                odds = self.trader.get_market_odds(self.market.yes_token)
+                odds = self.trader.get_market_odds(market.yes_token)
+                self.fair_value.update_odds(market.condition_id, odds)
+                fair = self.fair_value.quote(market.condition_id)
                 
                 # Update state for API
                 self.latest_signals = signals
                 self.latest_odds = odds
+                self.history.append({
+                    "timestamp": signals.timestamp.isoformat(),
+                    "btc_price": signals.btc_price,
+                    "yes_price": odds.yes_price,
+                    "no_price": odds.no_price
+                })
                 
-                decision: AIDecision = self.brain.analyze_market(signals, odds)
+                decision: AIDecision = await self.ensemble.decide(signals, odds, market)
+                self.tick_latencies.append((time.perf_counter() - tick_started) * 1000)
+                self.ticks += 1
+                self.last_tick_at = time.time()
                 
                 if decision.confidence > AI_CONFIDENCE_THRESHOLD and decision.action != "WAIT":
                     # Calculate fee for the brief
@@ -112,7 +221,8 @@ class TradingEngine:
                     dist = abs(price_limit - 0.50)
                     fee = 0.001 + (0.009 * (1 - (dist / 0.5)))
 
-                    self._generate_trade_brief(decision, signals, odds, fee)
+                    self._generate_trade_brief(decision, signals, odds, fee, fair)
+                    self.briefs_presented += 1
                     
                     # Store brief for API
                     self.latest_brief = {
@@ -121,6 +231,9 @@ class TradingEngine:
                         "reasoning": decision.reasoning,
                         "btc_price": signals.btc_price,
                         "fee": fee,
+                        "condition_id": market.condition_id,
+                        "question": market.question,
+                        "fair_value": fair.model_dump() if fair else None,
                         "timestamp": signals.timestamp.isoformat()
                     }
                     
@@ -131,15 +244,21 @@ class TradingEngine:
                             decision.confidence, 
                             decision.reasoning,
                             price_limit,
-                            self.market.yes_token if decision.action == "BUY_UP" else self.market.no_token
+                            market.yes_token if decision.action == "BUY_UP" else market.no_token
                         )
 
                     # Interactive Verification (Dual Mode: Terminal + API Queue)
                     print("\n[REQUEST REVIEW] Review the Trade Brief above.")
                     print("Type 'CONTINUE' in terminal OR POST to /trade/confirm via API.")
+
+                    # Drop confirmations aimed at an earlier (e.g. restored) brief, and stray terminal input
+                    for queue in (self.confirmation_queue, self.terminal_queue):
+                        while not queue.empty():
+                            queue.get_nowait()
                     
                     async def wait_for_terminal():
-                        return await asyncio.to_thread(input, "Type 'CONTINUE' to log Dry Run execution or 'SKIP' to ignore: ")
+                        print("Type 'CONTINUE' to log Dry Run execution or 'SKIP' to ignore: ", end="", flush=True)
+                        return await self.terminal_queue.get()
 
                     async def wait_for_api():
                         return await self.confirmation_queue.get()
@@ -156,9 +275,9 @@ class TradingEngine:
                     
                     if user_input.strip().upper() == 'CONTINUE':
                         if decision.action == "BUY_UP":
-                            self.trader.execute_trade(self.market.yes_token, DEFAULT_TRADE_AMOUNT, odds.yes_price + 0.01)
+                            self.trader.execute_trade(market.yes_token, DEFAULT_TRADE_AMOUNT, odds.yes_price + 0.01)
                         elif decision.action == "BUY_DOWN":
-                            self.trader.execute_trade(self.market.no_token, DEFAULT_TRADE_AMOUNT, odds.no_price + 0.01)
+                            self.trader.execute_trade(market.no_token, DEFAULT_TRADE_AMOUNT, odds.no_price + 0.01)
                         self.latest_brief = None # Clear after execution
                     else:
                         logger.info("Signal skipped.")
@@ -168,4 +287,4 @@ class TradingEngine:
             except Exception as e:
                 logger.error(f"Engine loop error: {e}")
                 
-            await asyncio.sleep(10)
+            await asyncio.sleep(self.tick_interval)
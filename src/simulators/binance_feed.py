@@ -0,0 +1,102 @@
+import asyncio
+import json
+import random
+import time
+import websockets
+from typing import Dict, Optional
+
+from helpers.logger import logger
+from helpers.constants import FEED_MESSAGE_INTERVAL
+
+class FakeBinanceDepthServer:
+    """
+    Local stand-in for the Binance depth20 stream with fault injection.
+
+    Point `DataStreamer(ws_url_template=server.url_template)` at it, then use
+    `drop_connections()`, `delay` / `jitter` / `drop_rate`, or `frozen = True` (socket
+    stays open but goes silent) to exercise reconnects, failover and staleness detection.
+
+    Like the real stream, every client receives the same frame per interval, and
+    `lastUpdateId` is derived from the clock so two fake servers stay roughly in step.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, interval: float = FEED_MESSAGE_INTERVAL, base_price: float = 60000.0, levels: int = 20):
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.price = base_price
+        self.levels = levels
+
+        self.frozen = False
+        self.delay = 0.0
+        self.jitter = 0.0
+        self.drop_rate = 0.0
+
+        self.update_id = 0
+        self.sent = 0
+        self.dropped = 0
+        self._clients: Dict = {}  # websocket -> queue of pending frames
+        self._server = None
+        self._producer: Optional[asyncio.Task] = None
+
+    @property
+    def url_template(self) -> str:
+        return f"ws://{self.host}:{self.port}/ws/{{symbol}}@depth20@100ms"
+
+    async def start(self):
+        self._server = await websockets.serve(self._handler, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._producer = asyncio.create_task(self._produce())
+        logger.info(f"Fake Binance depth server listening on ws://{self.host}:{self.port}")
+
+    async def stop(self):
+        if self._producer:
+            self._producer.cancel()
+            self._producer = None
+        for queue in self._clients.values():
+            queue.put_nowait(None)  # Wakes idle handlers so the server can close
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def drop_connections(self):
+        """Closes every open client socket, as an exchange-side disconnect would."""
+        for websocket in list(self._clients):
+            await websocket.close()
+
+    def _frame(self) -> str:
+        self.update_id = max(self.update_id + 1, int(time.time() * 1000))
+        self.price *= 1 + random.gauss(0, 0.0002)
+        bids = [[f"{self.price - i * 0.5:.2f}", f"{random.uniform(0.01, 5):.5f}"] for i in range(self.levels)]
+        asks = [[f"{self.price + (i + 1) * 0.5:.2f}", f"{random.uniform(0.01, 5):.5f}"] for i in range(self.levels)]
+        return json.dumps({"lastUpdateId": self.update_id, "bids": bids, "asks": asks})
+
+    async def _produce(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            if self.frozen or not self._clients:
+                continue
+            frame = self._frame()
+            for queue in self._clients.values():
+                queue.put_nowait(frame)
+
+    async def _handler(self, websocket, path: Optional[str] = None):
+        queue = asyncio.Queue()
+        self._clients[websocket] = queue
+        try:
+            while True:
+                frame = await queue.get()
+                if frame is None:
+                    return  # Server stopping; returning closes the connection
+                if self.delay or self.jitter:
+                    await asyncio.sleep(self.delay + random.uniform(0, self.jitter))
+                if self.drop_rate and random.random() < self.drop_rate:
+                    self.dropped += 1
+                    continue
+                await websocket.send(frame)
+                self.sent += 1
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._clients.pop(websocket, None)
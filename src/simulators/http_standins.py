@@ -0,0 +1,174 @@
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from helpers.logger import logger
+
+class HttpStandIns:
+    """
+    Minimal asyncio HTTP server standing in for the REST dependencies:
+    Binance funding (/fapi/v1/premiumIndex), Coinglass (/coinglass/...),
+    the Polymarket CLOB (/markets, /book) and Anthropic (/v1/messages).
+
+    `price_source` ties the generated payloads to the fake Binance feed;
+    `market_count` and `latency` can be changed while running.
+    """
+
+    def __init__(self, price_source: Callable[[], float], host: str = "127.0.0.1", port: int = 0, market_count: int = 1, latency: float = 0.0):
+        self.price_source = price_source
+        self.host = host
+        self.port = port
+        self.market_count = market_count
+        self.latency = latency
+        self.requests = Counter()
+        self._server = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"HTTP stand-ins listening on {self.base_url}")
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = (await reader.readline()).decode()
+            if not request_line:
+                return
+            method, target, _ = request_line.split(" ", 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode()
+                if line in ("\r\n", "\n", ""):
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            status, payload = self._route(method, target, body)
+            data = json.dumps(payload).encode()
+            writer.write(
+                f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"Stand-in request failed: {e}")
+        finally:
+            writer.close()
+
+    def _route(self, method: str, target: str, body: bytes) -> Tuple[int, object]:
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        path = url.path
+        self.requests[path] += 1
+
+        if path == "/fapi/v1/premiumIndex":
+            return 200, {"symbol": "BTCUSDT", "lastFundingRate": f"{random.gauss(0.0001, 0.00005):.8f}"}
+        if path.startswith("/coinglass/liquidation_info"):
+            return 200, {"code": "0", "data": [{"shortVolUsd": random.uniform(1e6, 5e7), "longVolUsd": random.uniform(1e6, 5e7)}]}
+        if path == "/coinglass/liquidation_map":
+            return 200, {"code": "0", "data": self._liquidation_levels()}
+        if path == "/markets":
+            return 200, {"limit": self.market_count, "count": self.market_count, "next_cursor": "LTE=", "data": self._markets()}
+        if path == "/book":
+            return 200, self._book(query.get("token_id", [""])[0])
+        if path == "/v1/messages" and method == "POST":
+            return 200, self._claude_message()
+        return 404, {"error": f"No stand-in for {method} {path}"}
+
+    def _liquidation_levels(self) -> list:
+        price = self.price_source()
+        return [[round(price * (1 + random.uniform(-0.03, 0.03)), 1), random.expovariate(1 / 2e6)] for _ in range(200)]
+
+    def _markets(self) -> list:
+        price = self.price_source()
+        now = datetime.now(timezone.utc)
+        markets = []
+        for i in range(self.market_count):
+            end_time = now + timedelta(minutes=1 + (i % 15))
+            strike = round(price * (1 + random.uniform(-0.002, 0.002)), 0)
+            # Every third market is an Up/Down window whose strike is the price at the open
+            if i % 3 == 2:
+                question = f"Bitcoin Up or Down - {end_time:%H:%M} UTC (15 min)"
+            else:
+                question = f"Will Bitcoin be above ${strike:,.0f} at {end_time:%H:%M} UTC? (15 min)"
+            markets.append({
+                "conditionId": f"0x{i:064x}",
+                "question": question,
+                "active": True,
+                "closed": False,
+                "accepting_orders": True,
+                "end_date_iso": end_time.isoformat(),
+                "description": "Soak test market",
+                "tokens": [
+                    {"token_id": f"{i}-up", "outcome": "Up", "price": 0.5},
+                    {"token_id": f"{i}-down", "outcome": "Down", "price": 0.5}
+                ]
+            })
+        return markets
+
+    def _book(self, token_id: str) -> dict:
+        best_bid = round(random.uniform(0.3, 0.7), 2)
+        return {
+            "market": "0x0",
+            "asset_id": token_id,
+            "timestamp": str(int(time.time() * 1000)),
+            "hash": "0x0",
+            "bids": [{"price": f"{best_bid:.2f}", "size": "100"}],
+            "asks": [{"price": f"{best_bid + 0.01:.2f}", "size": "100"}],
+            "min_order_size": "5",
+            "tick_size": "0.01",
+            "neg_risk": False,
+            "last_trade_price": f"{best_bid:.2f}"
+        }
+
+    def _claude_message(self) -> dict:
+        action = random.choice(["BUY_UP", "BUY_DOWN", "WAIT"])
+        decision = {
+            "action": action,
+            "confidence": round(random.uniform(0.85, 0.95) if action != "WAIT" else 0.5, 2),
+            "reasoning": "Soak stand-in: 1) Trend Analysis: n/a, 2) Order Book Wall status: n/a, 3) Liquidation/Funding context: n/a."
+        }
+        return {
+            "id": f"msg_{random.getrandbits(48):012x}",
+            "type": "message",
+            "role": "assistant",
+            "model": "stand-in",
+            "content": [{"type": "text", "text": json.dumps(decision)}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 1, "output_tokens": 1}
+        }
+
+async def http_request(host: str, port: int, method: str, path: str, body: Optional[dict] = None, timeout: float = 10.0) -> Tuple[int, bytes]:
+    """Tiny HTTP/1.1 client on asyncio streams (no extra threads, no extra dependencies)."""
+    data = json.dumps(body).encode() if body is not None else b""
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {host}:{port}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data
+        )
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1]) if head else 0
+    return status, payload
@@ -0,0 +1,345 @@
+"""
+Synthetic load and soak harness for the full bot.
+
+Starts `main()` in-process against local stand-ins for Binance, Coinglass, the CLOB and
+Anthropic, ramps the depth feed rate and market count, hammers the API, and samples
+memory, event-loop lag, tick latency, dropped feed updates, threads, tasks and the
+suggestions file over time. Ends with a report that flags likely leaks.
+
+    cd src && python -m simulators.soak --duration 600 --rate-multiplier 10 --max-markets 50
+
+Run it for 24h with `--duration 86400`. Everything (logs, suggestions.log, state/, the
+report) is written to a fresh working directory so real bot state is never touched.
+Bot modules are imported only after the environment points them at the stand-ins.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SOAK_ENDPOINTS = ["/health", "/status", "/signals", "/feeds", "/loop", "/strategies", "/fair-value", "/trade/latest", "/suggestions", "/markets"]
+SOAK_MEMORY_SLOPE_LIMIT_MB_PER_HOUR = 20
+SOAK_MEMORY_MIN_WINDOW_S = 900  # Shorter steady windows only see warm-up noise
+SOAK_MEMORY_MIN_GROWTH_MB = 20
+SOAK_TASK_GROWTH_LIMIT = 10
+SOAK_DROPPED_RATIO_LIMIT = 0.01
+SOAK_LOOP_P99_LIMIT_MS = 100
+SOAK_TICK_STALL_INTERVALS = 10  # Engine ticks missed (while the feed is live) before flagging a stall
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Soak-test the bot against local stand-ins.")
+    parser.add_argument("--duration", type=float, default=600, help="Total run time in seconds")
+    parser.add_argument("--ramp-steps", type=int, default=5, help="Number of load steps between baseline and peak")
+    parser.add_argument("--rate-multiplier", type=float, default=10, help="Peak Binance message rate as a multiple of 10 msg/s")
+    parser.add_argument("--max-markets", type=int, default=50, help="Peak number of concurrent markets served by the CLOB stand-in")
+    parser.add_argument("--api-concurrency", type=int, default=8, help="Concurrent API clients")
+    parser.add_argument("--tick-interval", type=float, default=1.0, help="Engine tick interval (seconds)")
+    parser.add_argument("--sample-interval", type=float, default=5.0, help="Seconds between metric samples")
+    parser.add_argument("--api-port", type=int, default=8765)
+    parser.add_argument("--workdir", default=None, help="Working directory (default: a fresh temp dir)")
+    parser.add_argument("--verbose", action="store_true", help="Keep the bot's INFO console logging")
+    return parser.parse_args()
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        # Peak rather than current RSS; KB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+def percentile(values, p: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2)
+
+def slope_per_hour(samples, key: str) -> float:
+    """Least-squares slope of `key` over time, per hour."""
+    points = [(s["t"], s[key]) for s in samples if s.get(key) is not None]
+    if len(points) < 2:
+        return 0.0
+    mean_t = sum(t for t, _ in points) / len(points)
+    mean_v = sum(v for _, v in points) / len(points)
+    var_t = sum((t - mean_t) ** 2 for t, _ in points)
+    if not var_t:
+        return 0.0
+    return sum((t - mean_t) * (v - mean_v) for t, v in points) / var_t * 3600
+
+class StandInThread(threading.Thread):
+    """Hosts the stand-ins and the API load generator on their own event loop."""
+
+    def __init__(self, args):
+        super().__init__(name="soak-standins", daemon=True)
+        self.args = args
+        self.ready = threading.Event()
+        self.stopping = False
+        self.binance = None
+        self.http = None
+        self.api_latencies = []
+        self.api_requests = 0
+        self.api_errors = 0
+        self.confirmations = 0
+        self.api_up = False
+
+    def run(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        from simulators.binance_feed import FakeBinanceDepthServer
+        from simulators.http_standins import HttpStandIns
+
+        self.binance = FakeBinanceDepthServer()
+        await self.binance.start()
+        self.http = HttpStandIns(price_source=lambda: self.binance.price)
+        await self.http.start()
+        self.ready.set()
+
+        workers = [asyncio.create_task(self._api_worker()) for _ in range(self.args.api_concurrency)]
+        workers.append(asyncio.create_task(self._confirmer()))
+        while not self.stopping:
+            await asyncio.sleep(0.2)
+        for worker in workers:
+            worker.cancel()
+        await self.binance.stop()
+        await self.http.stop()
+
+    async def _api_worker(self):
+        from simulators.http_standins import http_request
+
+        while True:
+            path = random.choice(SOAK_ENDPOINTS)
+            started = time.perf_counter()
+            try:
+                status, _ = await http_request("127.0.0.1", self.args.api_port, "GET", path)
+                self.api_up = True
+                if status >= 500 or status == 0:
+                    self.api_errors += 1
+            except Exception:
+                if not self.api_up:
+                    await asyncio.sleep(0.5)  # API still starting
+                    continue
+                self.api_errors += 1
+            self.api_requests += 1
+            self.api_latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.05)
+
+    async def _confirmer(self):
+        """Confirms every pending brief through the API, as a remote operator would."""
+        from simulators.http_standins import http_request
+
+        while True:
+            await asyncio.sleep(0.5)
+            try:
+                status, payload = await http_request("127.0.0.1", self.args.api_port, "GET", "/trade/latest")
+                brief = json.loads(payload).get("brief") if status == 200 else None
+                if brief and not brief.get("restored"):
+                    await http_request("127.0.0.1", self.args.api_port, "POST", "/trade/confirm", {"command": "CONTINUE"})
+                    self.confirmations += 1
+            except Exception:
+                pass
+
+async def run_soak(args, standins: StandInThread, stdin_write: int) -> dict:
+    from main import main
+    from helpers.logger import logger
+    from helpers.service_locator import service_locator
+    from services.trading_engine import TradingEngine
+    from services.data_streamer import DataStreamer
+    from services.loop_monitor import LoopMonitor
+
+    bot = asyncio.create_task(main())
+    started = time.monotonic()
+    samples = []
+    step_duration = args.duration / max(1, args.ramp_steps)
+    base_interval = standins.binance.interval
+
+    while time.monotonic() - started < args.duration:
+        elapsed = time.monotonic() - started
+        step = min(args.ramp_steps - 1, int(elapsed / step_duration))
+        frac = step / max(1, args.ramp_steps - 1)
+        standins.binance.interval = base_interval / (1 + frac * (args.rate_multiplier - 1))
+        standins.http.market_count = round(1 + frac * (args.max_markets - 1))
+
+        await asyncio.sleep(args.sample_interval)
+        if bot.done():
+            logger.error(f"Bot exited early: {bot.exception() if not bot.cancelled() else 'cancelled'}")
+            break
+
+        try:
+            engine = service_locator.get(TradingEngine)
+            streamer = service_locator.get(DataStreamer)
+            loop_stats = service_locator.get(LoopMonitor).get_stats()
+        except ValueError:
+            continue  # Still bootstrapping
+
+        received = sum(c.messages for c in streamer.feed.connections) if streamer.feed else 0
+        sample = {
+            "t": round(time.monotonic() - started, 1),
+            "feed_rate_hz": round(1 / standins.binance.interval, 1),
+            "markets": standins.http.market_count,
+            "rss_mb": round(rss_mb(), 1),
+            "threads": threading.active_count(),
+            "tasks": len(asyncio.all_tasks()),
+            "loop_p99_ms": loop_stats["p99_ms"],
+            "loop_max_ms": loop_stats["max_ms"],
+            "tick_p50_ms": percentile(engine.tick_latencies, 0.50),
+            "tick_p99_ms": percentile(engine.tick_latencies, 0.99),
+            "ticks": engine.ticks,
+            "tick_age_s": round(time.time() - engine.last_tick_at, 1) if engine.last_tick_at else None,
+            "feed_stale": streamer.feed.is_stale if streamer.feed else True,
+            "feed_sent": standins.binance.sent,
+            "feed_received": received,
+            "briefs": engine.briefs_presented,
+            "confirmations": standins.confirmations,
+            "api_requests": standins.api_requests,
+            "api_errors": standins.api_errors,
+            "api_p99_ms": percentile(standins.api_latencies[-1000:], 0.99),
+            "suggestions_bytes": os.path.getsize("suggestions.log") if os.path.exists("suggestions.log") else 0
+        }
+        samples.append(sample)
+        print(
+            f"[soak t={sample['t']:>7}s] rate={sample['feed_rate_hz']}Hz markets={sample['markets']} "
+            f"rss={sample['rss_mb']}MB threads={sample['threads']} tasks={sample['tasks']} "
+            f"loop_p99={sample['loop_p99_ms']}ms ticks={sample['ticks']} tick_p99={sample['tick_p99_ms']}ms "
+            f"feed={sample['feed_received']}/{sample['feed_sent']} briefs={sample['briefs']} api_err={sample['api_errors']}",
+            flush=True
+        )
+
+    bot.cancel()
+    try:
+        await bot
+    except (asyncio.CancelledError, Exception):
+        pass
+    os.close(stdin_write)  # EOF ends the bot's terminal reader thread
+    return analyse(samples, service_locator.get(LoopMonitor).get_stats(), args.tick_interval)
+
+def longest_tick_stall(samples: list) -> tuple:
+    """
+    Longest stretch (seconds, start time) over which the engine completed no tick while
+    the feed kept delivering. Reads the tick counter, not tick latencies, which simply
+    stop changing when the engine stops.
+    """
+    longest, longest_start = 0.0, None
+    run_start = None
+    for prev, cur in zip(samples, samples[1:]):
+        feed_live = not cur["feed_stale"] and cur["feed_received"] > prev["feed_received"]
+        if cur["ticks"] == prev["ticks"] and feed_live:
+            run_start = prev["t"] if run_start is None else run_start
+            if cur["t"] - run_start > longest:
+                longest, longest_start = cur["t"] - run_start, run_start
+        else:
+            run_start = None
+    return longest, longest_start
+
+def analyse(samples: list, loop_stats: dict, tick_interval: float) -> dict:
+    """Turns the sample series into a report with leak / degradation flags."""
+    flags = []
+    steady = samples[max(1, len(samples) // 10):] or samples
+    if not steady:
+        return {"samples": [], "flags": ["No samples collected (bot never finished bootstrapping)."]}
+    first, last = steady[0], steady[-1]
+    hours = max(1e-9, (last["t"] - first["t"]) / 3600)
+
+    memory_slope = slope_per_hour(steady, "rss_mb")
+    memory_growth = last["rss_mb"] - first["rss_mb"]
+    if (last["t"] - first["t"] >= SOAK_MEMORY_MIN_WINDOW_S and memory_growth > SOAK_MEMORY_MIN_GROWTH_MB
+            and memory_slope > SOAK_MEMORY_SLOPE_LIMIT_MB_PER_HOUR):
+        flags.append(f"Memory growing at {memory_slope:.1f} MB/h ({first['rss_mb']} -> {last['rss_mb']} MB).")
+
+    thread_growth = last["threads"] - first["threads"]
+    confirmed = last["confirmations"] - first["confirmations"]
+    if thread_growth > 0:
+        flags.append(f"Thread count grew by {thread_growth} over {confirmed} API confirmations.")
+
+    stall, stall_start = longest_tick_stall(samples)
+    if stall >= SOAK_TICK_STALL_INTERVALS * tick_interval:
+        flags.append(
+            f"Engine stopped ticking for {stall:.0f}s from t={stall_start}s while the feed was live "
+            f"(tick interval {tick_interval}s; ticks {samples[-1]['ticks']}, briefs {samples[-1]['briefs']})."
+        )
+
+    task_growth = last["tasks"] - first["tasks"]
+    if task_growth > SOAK_TASK_GROWTH_LIMIT:
+        flags.append(f"asyncio task count grew by {task_growth}.")
+
+    suggestion_growth = last["suggestions_bytes"] - first["suggestions_bytes"]
+    if suggestion_growth > 0:
+        per_day = suggestion_growth / hours * 24
+        flags.append(f"suggestions.log grows without bound: +{suggestion_growth:,} bytes (~{per_day / 1e6:.1f} MB/day, never rotated; /suggestions reads it whole).")
+
+    sent, received = last["feed_sent"], last["feed_received"]
+    if sent and (sent - received) / sent > SOAK_DROPPED_RATIO_LIMIT:
+        flags.append(f"Dropped feed updates: {sent - received:,} of {sent:,} ({(sent - received) / sent:.1%}).")
+
+    if (loop_stats.get("p99_ms") or 0) > SOAK_LOOP_P99_LIMIT_MS:
+        flags.append(f"Event-loop lag p99 {loop_stats['p99_ms']}ms; top blockers: {loop_stats['blocked_ms_by_service']}.")
+
+    if last["api_errors"]:
+        flags.append(f"{last['api_errors']} API errors out of {last['api_requests']} requests.")
+
+    return {
+        "duration_s": last["t"],
+        "memory_slope_mb_per_hour": round(memory_slope, 2),
+        "memory_growth_mb": round(memory_growth, 1),
+        "longest_tick_stall_s": stall,
+        "loop": {k: v for k, v in loop_stats.items() if k != "recent_stalls"},
+        "flags": flags,
+        "samples": samples
+    }
+
+if __name__ == "__main__":
+    args = parse_args()
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="soak-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    os.chdir(workdir)
+
+    # Keep stdin open but silent, like an unattended terminal, so terminal prompts block.
+    stdin_read, stdin_write = os.pipe()
+    sys.stdin = os.fdopen(stdin_read)
+
+    standins = StandInThread(args)
+    standins.start()
+    standins.ready.wait()
+
+    os.environ.update({
+        "APP_ENV": "soak",
+        "ANTHROPIC_API_KEY": "soak-test-key",
+        "ANTHROPIC_BASE_URL": standins.http.base_url,
+        "COINGLASS_API_KEY": "soak-test-key",
+        "CLOB_HOST": standins.http.base_url,
+        "BINANCE_WS_URL_TEMPLATE": standins.binance.url_template,
+        "BINANCE_STANDBY_WS_URL_TEMPLATE": standins.binance.url_template,
+        "BINANCE_FUNDING_URL_TEMPLATE": f"{standins.http.base_url}/fapi/v1/premiumIndex?symbol={{symbol}}",
+        "COINGLASS_LIQUIDATION_URL": f"{standins.http.base_url}/coinglass/liquidation_info",
+        "COINGLASS_LIQUIDATION_MAP_URL": f"{standins.http.base_url}/coinglass/liquidation_map",
+        "API_HOST": "127.0.0.1",
+        "API_PORT": str(args.api_port),
+        "ENGINE_TICK_INTERVAL": str(args.tick_interval),
+        "API_LOG_LEVEL": "info" if args.verbose else "warning"
+    })
+
+    from helpers.logger import logger
+    if not args.verbose:
+        for handler in logger.handlers:
+            if not isinstance(handler, logging.FileHandler):
+                handler.setLevel(logging.WARNING)
+
+    report = asyncio.run(run_soak(args, standins, stdin_write))
+    standins.stopping = True
+
+    with open("soak_report.json", "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSoak report written to {workdir / 'soak_report.json'}")
+    for flag in report["flags"]:
+        print(f"  FLAG: {flag}")
+    if not report["flags"]:
+        print("  No leaks or degradation flagged.")
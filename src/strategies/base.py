@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Optional
+
+from models.ai import AIDecision
+from models.internal import SignalSnapshot, OddsSnapshot
+from models.polymarket import MarketInfo
+from models.strategy import SignalFeatures
+
+class Strategy(ABC):
+    """
+    A decision maker evaluated by the StrategyEnsemble on a shared snapshot.
+
+    `cpu_bound` strategies run in the ensemble's process pool (they must be picklable),
+    `blocking` ones (sync I/O) in the ensemble's thread pool, everything else inline on the loop.
+    `expensive` strategies are only consulted when the cheap ones disagree (escalate mode).
+    """
+    name: str = "strategy"
+    cpu_bound: bool = False
+    blocking: bool = False
+    expensive: bool = False
+
+    @abstractmethod
+    def evaluate(self, features: SignalFeatures, signals: SignalSnapshot, odds: OddsSnapshot) -> AIDecision:
+        ...
+
+def compute_features(signals: SignalSnapshot, odds: OddsSnapshot, market: Optional[MarketInfo]) -> SignalFeatures:
+    """Derives the features every strategy shares, once per tick."""
+    bid_volume = sum(w.volume for w in signals.order_book.top_bid_walls)
+    ask_volume = sum(w.volume for w in signals.order_book.top_ask_walls)
+    total_volume = bid_volume + ask_volume
+
+    liquidations = signals.liquidations
+    total_liquidations = liquidations.short_vol + liquidations.long_vol
+
+    # Price is drawn toward the nearer liquidation cluster: +1 above, -1 below
+    cluster_pull = 0.0
+    above, below = liquidations.cluster_above, liquidations.cluster_below
+    if above and (not below or above.distance_pct < -below.distance_pct):
+        cluster_pull = 1.0
+    elif below:
+        cluster_pull = -1.0
+
+    strike = market.strike if market else None
+    seconds_remaining = None
+    if market and market.end_time:
+        end_time = market.end_time if market.end_time.tzinfo else market.end_time.replace(tzinfo=timezone.utc)
+        seconds_remaining = max(0.0, (end_time - datetime.now(timezone.utc)).total_seconds())
+
+    return SignalFeatures(
+        condition_id=market.condition_id if market else None,
+        btc_price=signals.btc_price,
+        bid_wall_volume=bid_volume,
+        ask_wall_volume=ask_volume,
+        wall_imbalance=(bid_volume - ask_volume) / total_volume if total_volume else 0.0,
+        funding_rate=signals.funding.current_funding_rate if signals.funding else 0.0,
+        liquidation_skew=(liquidations.short_vol - liquidations.long_vol) / total_liquidations if total_liquidations else 0.0,
+        cluster_pull=cluster_pull,
+        yes_price=odds.yes_price,
+        no_price=odds.no_price,
+        strike=strike,
+        seconds_remaining=seconds_remaining,
+        distance_to_strike_pct=(signals.btc_price - strike) / strike if strike else None
+    )
@@ -0,0 +1,63 @@
+import math
+from typing import Optional, Tuple
+
+from helpers.constants import FAIR_VALUE_DEFAULT_VOL, FAIR_VALUE_MIN_EDGE, SECONDS_PER_YEAR
+from models.ai import AIDecision
+from models.internal import SignalSnapshot, OddsSnapshot
+from models.strategy import SignalFeatures
+from services.fair_value import FairValueEngine
+from strategies.base import Strategy
+
+class FairValueStrategy(Strategy):
+    """
+    Prices the UP token as P(BTC closes above strike) under a lognormal model and trades the edge.
+    With a FairValueEngine it trades the engine's quote for the market (live realised vol), so the
+    ensemble, the Trade Brief and the API see the same numbers; without one it prices the market
+    itself at a constant vol.
+    """
+    name = "fair_value"
+
+    def __init__(self, annual_vol: float = FAIR_VALUE_DEFAULT_VOL, min_edge: float = FAIR_VALUE_MIN_EDGE, engine: FairValueEngine = None):
+        self.annual_vol = annual_vol
+        self.min_edge = min_edge
+        self.engine = engine
+
+    def probability_up(self, spot: float, strike: float, seconds_remaining: float) -> float:
+        if seconds_remaining <= 0:
+            return 1.0 if spot > strike else 0.0
+        sigma = self.annual_vol * math.sqrt(seconds_remaining / SECONDS_PER_YEAR)
+        d2 = (math.log(spot / strike) - 0.5 * sigma * sigma) / sigma
+        return 0.5 * (1 + math.erf(d2 / math.sqrt(2)))
+
+    def _fair_value(self, features: SignalFeatures) -> Optional[Tuple[float, float, float, float]]:
+        """(P(up), strike, seconds remaining, annual vol), or None if the market can't be priced yet."""
+        if self.engine:
+            quote = self.engine.quote(features.condition_id) if features.condition_id else None
+            if not quote or quote.fair_up is None:
+                return None
+            return quote.fair_up, quote.strike, quote.seconds_remaining, self.engine.vol.annualized()
+
+        if not features.strike or features.seconds_remaining is None:
+            return None
+        p_up = self.probability_up(features.btc_price, features.strike, features.seconds_remaining)
+        return p_up, features.strike, features.seconds_remaining, self.annual_vol
+
+    def evaluate(self, features: SignalFeatures, signals: SignalSnapshot, odds: OddsSnapshot) -> AIDecision:
+        fair = self._fair_value(features)
+        if fair is None:
+            return AIDecision(action="WAIT", confidence=0.0, reasoning="No strike/expiry known for this market.")
+
+        p_up, strike, seconds_remaining, vol = fair
+        up_edge = p_up - features.yes_price
+        down_edge = (1 - p_up) - features.no_price
+        reasoning = (
+            f"Fair UP {p_up:.3f} vs {features.yes_price:.3f} (edge {up_edge:+.3f}), "
+            f"DOWN {1 - p_up:.3f} vs {features.no_price:.3f} (edge {down_edge:+.3f}), "
+            f"{seconds_remaining:.0f}s left, strike ${strike:,.2f}, vol {vol:.1%}."
+        )
+
+        if up_edge >= self.min_edge and up_edge >= down_edge:
+            return AIDecision(action="BUY_UP", confidence=p_up, reasoning=reasoning)
+        if down_edge >= self.min_edge:
+            return AIDecision(action="BUY_DOWN", confidence=1 - p_up, reasoning=reasoning)
+        return AIDecision(action="WAIT", confidence=1.0 - max(abs(up_edge), abs(down_edge)), reasoning=reasoning)
@@ -0,0 +1,17 @@
+from models.ai import AIDecision
+from models.internal import SignalSnapshot, OddsSnapshot
+from models.strategy import SignalFeatures
+from services.brain import Brain
+from strategies.base import Strategy
+
+class LLMStrategy(Strategy):
+    """Claude-backed analysis via the Brain. Sync API client, so it runs in the ensemble's thread pool."""
+    name = "llm"
+    blocking = True
+    expensive = True
+
+    def __init__(self, brain: Brain):
+        self.brain = brain
+
+    def evaluate(self, features: SignalFeatures, signals: SignalSnapshot, odds: OddsSnapshot) -> AIDecision:
+        return self.brain.analyze_market(signals, odds)
@@ -0,0 +1,26 @@
+from helpers.constants import WALL_IMBALANCE_THRESHOLD, STRATEGY_MAX_ENTRY_PRICE
+from models.ai import AIDecision
+from models.internal import SignalSnapshot, OddsSnapshot
+from models.strategy import SignalFeatures
+from strategies.base import Strategy
+
+class WallImbalanceStrategy(Strategy):
+    """Deterministic rules on Binance wall imbalance, nudged by the nearest liquidation cluster."""
+    name = "wall_imbalance"
+
+    def __init__(self, threshold: float = WALL_IMBALANCE_THRESHOLD, max_entry_price: float = STRATEGY_MAX_ENTRY_PRICE):
+        self.threshold = threshold
+        self.max_entry_price = max_entry_price
+
+    def evaluate(self, features: SignalFeatures, signals: SignalSnapshot, odds: OddsSnapshot) -> AIDecision:
+        score = 0.7 * features.wall_imbalance + 0.3 * features.cluster_pull
+        reasoning = f"Wall imbalance {features.wall_imbalance:+.2f}, cluster pull {features.cluster_pull:+.0f}, score {score:+.2f}."
+
+        if score >= self.threshold and features.yes_price < self.max_entry_price:
+            action = "BUY_UP"
+        elif score <= -self.threshold and features.no_price < self.max_entry_price:
+            action = "BUY_DOWN"
+        else:
+            return AIDecision(action="WAIT", confidence=1.0 - min(1.0, abs(score)), reasoning=reasoning)
+
+        return AIDecision(action=action, confidence=min(1.0, 0.5 + abs(score) / 2), reasoning=reasoning)
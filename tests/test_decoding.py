@@ -0,0 +1,76 @@
+"""Every installed decoder must produce the same depth frames and market dicts."""
+import json
+
+import pytest
+
+from helpers.decoding import DepthFrame, available_decoders, get_decoder
+
+DEPTH = json.dumps({
+    "lastUpdateId": 160,
+    "bids": [["60000.10", "1.50"], ["59999.00", "0.25"]],
+    "asks": [["60000.20", "2.00"]]
+}).encode()
+
+MARKETS = [
+    {
+        "conditionId": "0xabc",
+        "question": "Bitcoin Up or Down - 3:00PM ET (15 min)",
+        "active": True,
+        "closed": False,
+        "accepting_orders": True,
+        "end_date_iso": "2026-10-19T19:15:00Z",
+        "tokens": [
+            {"token_id": "1", "outcome": "Up", "price": 0.55},
+            {"token_id": "2", "outcome": "Down", "price": 0.45}
+        ]
+    },
+    {"conditionId": "0xdef", "title": "Ethereum above $3,000?", "active": False, "clobTokenIds": ["3", "4"]}
+]
+
+@pytest.fixture(params=available_decoders())
+def decoder(request):
+    return get_decoder(request.param)
+
+def test_depth_frame(decoder):
+    frame = decoder.decode_depth(DEPTH)
+    assert frame == DepthFrame(
+        bids=[(60000.10, 1.50), (59999.00, 0.25)],
+        asks=[(60000.20, 2.00)],
+        last_update_id=160
+    )
+    assert all(isinstance(price, float) for price, _ in frame.bids + frame.asks)
+
+def test_depth_frame_without_update_id(decoder):
+    frame = decoder.decode_depth(b'{"bids": [["1.0", "2.0"]], "asks": []}')
+    assert frame == DepthFrame(bids=[(1.0, 2.0)], asks=[], last_update_id=None)
+
+@pytest.mark.parametrize("payload", [
+    json.dumps(MARKETS).encode(),
+    json.dumps({"data": MARKETS, "next_cursor": "LTE="}).encode(),
+    (" \n" + json.dumps(MARKETS)).encode()
+], ids=["bare-list", "data-envelope", "leading-whitespace"])
+def test_markets_match_stdlib(decoder, payload):
+    assert decoder.decode_markets(payload) == MARKETS
+
+def test_markets_partial_decode_drops_unused_fields(decoder):
+    payload = json.dumps([dict(MARKETS[0], description="long text", rewards={"rates": []})]).encode()
+    markets = decoder.decode_markets(payload)
+    assert markets[0]["conditionId"] == "0xabc"
+    if decoder.name == "msgspec":
+        assert "description" not in markets[0]
+
+@pytest.mark.parametrize("drifted", [
+    dict(MARKETS[0], active="yes"),
+    dict(MARKETS[0], tokens=[{"token_id": 1, "outcome": "Up", "price": "0.55"}]),
+    dict(MARKETS[0], end_date_iso=1760900000)
+], ids=["active-string", "token-types", "end-date-number"])
+@pytest.mark.parametrize("envelope", [lambda m: m, lambda m: {"data": m}], ids=["bare-list", "data-envelope"])
+def test_schema_drift_falls_back_to_full_decode(decoder, drifted, envelope):
+    # For msgspec these fail the partial `MarketFields` schema; the full decode keeps them intact
+    payload = json.dumps(envelope([drifted, MARKETS[1]])).encode()
+    assert decoder.decode_markets(payload) == [drifted, MARKETS[1]]
+
+def test_empty_and_unexpected_payloads(decoder):
+    assert decoder.decode_markets(b"[]") == []
+    assert decoder.decode_markets(b'{"data": []}') == []
+    assert decoder.decode_markets(b'{"next_cursor": "LTE="}') == []
@@ -0,0 +1,106 @@
+"""Fair-value engine pricing and the strategy built on it."""
+import math
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.internal import BookWalls, OddsSnapshot, SignalSnapshot
+from models.market import LiquidationData
+from models.polymarket import MarketInfo
+from services.fair_value import FairValueEngine, RealizedVolatility
+from strategies.base import compute_features
+from strategies.fair_value import FairValueStrategy
+
+def make_market(condition_id: str, strike, seconds_left: float) -> MarketInfo:
+    return MarketInfo(
+        condition_id=condition_id,
+        question=f"Bitcoin Up or Down {condition_id} (15 min)",
+        yes_token=f"{condition_id}-up",
+        no_token=f"{condition_id}-down",
+        active=True,
+        strike=strike,
+        end_time=datetime.now(timezone.utc) + timedelta(seconds=seconds_left)
+    )
+
+def make_signals(price: float) -> SignalSnapshot:
+    return SignalSnapshot(
+        timestamp=datetime.now(),
+        btc_price=price,
+        order_book=BookWalls(top_bid_walls=[], top_ask_walls=[]),
+        funding=None,
+        liquidations=LiquidationData(short_vol=0.0, long_vol=0.0)
+    )
+
+def test_engine_matches_scalar_model_across_markets():
+    engine = FairValueEngine()
+    markets = [make_market(str(i), 60000.0 + 50 * (i - 5), 60.0 + 30 * i) for i in range(100)]
+    engine.set_markets(markets)
+    engine.on_book_update(60010.0, time.time())
+
+    scalar = FairValueStrategy(annual_vol=engine.vol.annualized())
+    for market in (markets[0], markets[50], markets[99]):
+        quote = engine.quote(market.condition_id)
+        expected = scalar.probability_up(60010.0, market.strike, quote.seconds_remaining)
+        assert quote.fair_up == pytest.approx(expected, abs=1e-6)
+        assert quote.fair_up + quote.fair_down == pytest.approx(1.0)
+
+def test_realized_volatility_annualises_sampled_returns():
+    vol = RealizedVolatility(sample_interval=1.0, window=100, min_samples=10)
+    price, ts = 60000.0, 0.0
+    for i in range(101):
+        vol.update(price * math.exp(0.001 * (-1) ** i), ts + i)
+    assert vol.samples == 100
+    assert vol.annualized() == pytest.approx(0.002 * math.sqrt(31_536_000), rel=1e-6)
+
+def test_up_down_window_takes_strike_from_price_at_open():
+    engine = FairValueEngine(window_seconds=900)
+    now = time.time()
+    for i in range(600):
+        engine.on_book_update(60000.0 + i, now - 600 + i)
+    market = make_market("window", None, 600)  # Opened 300s ago
+    engine.set_markets([market])
+
+    assert market.strike == pytest.approx(60300.0, abs=1.0)
+    assert engine.quote("window").fair_up is not None
+
+def test_strategy_uses_engine_quote():
+    engine = FairValueEngine()
+    market = make_market("m", 60000.0, 300)
+    engine.set_markets([market])
+    engine.on_book_update(60300.0, time.time())
+    odds = OddsSnapshot(yes_price=0.55, no_price=0.45)
+    engine.update_odds("m", odds)
+
+    signals = make_signals(60300.0)
+    decision = FairValueStrategy(engine=engine).evaluate(compute_features(signals, odds, market), signals, odds)
+
+    quote = engine.quote("m")
+    assert decision.action == "BUY_UP"
+    assert decision.confidence == quote.fair_up
+    assert f"edge {quote.up_edge:+.3f}" in decision.reasoning
+
+def test_strategy_waits_until_engine_can_price_the_market():
+    engine = FairValueEngine()
+    market = make_market("pending", None, 600)
+    engine.set_markets([market])
+    odds = OddsSnapshot(yes_price=0.5, no_price=0.5)
+    signals = make_signals(60000.0)
+
+    decision = FairValueStrategy(engine=engine).evaluate(compute_features(signals, odds, market), signals, odds)
+    assert decision.action == "WAIT"
+
+def test_refresh_takes_fresh_catalog_prices():
+    engine = FairValueEngine()
+    first = make_market("a", 60000.0, 300)
+    first.yes_price, first.no_price = 0.5, 0.5
+    engine.set_markets([first])
+    engine.on_book_update(60000.0, time.time())
+
+    refreshed = first.model_copy(update={"yes_price": 0.8, "no_price": None})
+    engine.set_markets([refreshed])
+
+    quote = engine.quote("a")
+    assert quote.up_price == 0.8
+    assert quote.down_price == 0.5  # No catalog price: previous one kept
+    assert quote.up_edge == pytest.approx(quote.fair_up - 0.8, abs=1e-6)
@@ -0,0 +1,131 @@
+"""Feed manager behaviour against the local fake Binance depth server (fault injection)."""
+import asyncio
+import time
+
+from helpers.constants import FEED_BACKOFF_BASE, FEED_BACKOFF_MAX
+from services.data_streamer import DataStreamer
+from services.feed_connection import FeedConnection, FeedConnectionManager
+from simulators.binance_feed import FakeBinanceDepthServer
+
+INTERVAL = 0.05
+STALE_AFTER = 0.5
+
+async def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        await asyncio.sleep(0.02)
+    return condition()
+
+async def start_servers(count: int):
+    servers = [FakeBinanceDepthServer(interval=INTERVAL) for _ in range(count)]
+    for server in servers:
+        await server.start()
+    return servers
+
+def make_feed(streamer: DataStreamer, primary: FakeBinanceDepthServer, standby: FakeBinanceDepthServer = None) -> FeedConnectionManager:
+    return FeedConnectionManager(
+        primary.url_template.format(symbol="btcusdt"),
+        on_message=streamer._on_depth_message,
+        on_stale=streamer._invalidate_book,
+        hot_standby=standby is not None,
+        standby_url=standby.url_template.format(symbol="btcusdt") if standby else None,
+        name="test",
+        message_interval=INTERVAL,
+        stale_after=STALE_AFTER
+    )
+
+def run_scenario(scenario, servers: int = 1):
+    async def main():
+        fakes = await start_servers(servers)
+        streamer = DataStreamer()
+        streamer.feed = make_feed(streamer, *fakes)
+        task = asyncio.create_task(streamer.feed.run())
+        try:
+            assert await wait_for(lambda: streamer.book_valid)
+            await scenario(streamer, *fakes)
+        finally:
+            task.cancel()
+            for fake in fakes:
+                await fake.stop()
+    asyncio.run(main())
+
+def test_backoff_is_jittered_and_capped():
+    connection = FeedConnection("test", "ws://unused", lambda c, m: None)
+    for failures, cap in ((0, FEED_BACKOFF_BASE), (3, FEED_BACKOFF_BASE * 8), (30, FEED_BACKOFF_MAX)):
+        connection.consecutive_failures = failures
+        delays = [connection.backoff_delay() for _ in range(200)]
+        assert all(0 <= d <= cap for d in delays)
+        assert len(set(delays)) > 1
+
+def test_reconnects_after_server_drop():
+    async def scenario(streamer, server):
+        connection = streamer.feed.connections[0]
+        await server.drop_connections()
+        assert await wait_for(lambda: connection.reconnects >= 1)
+        messages = connection.messages
+        assert await wait_for(lambda: connection.connected and connection.messages > messages)
+        assert streamer.book_valid
+
+    run_scenario(scenario)
+
+def test_dropped_frames_keep_book_valid():
+    async def scenario(streamer, server):
+        server.drop_rate = 0.5
+        assert await wait_for(lambda: server.dropped >= 5)
+        assert streamer.book_valid
+        assert streamer.feed.connections[0].reconnects == 0
+
+    run_scenario(scenario)
+
+def test_frozen_stream_invalidates_book_and_recovers():
+    async def scenario(streamer, server):
+        server.frozen = True
+        assert await wait_for(lambda: not streamer.book_valid)
+        assert streamer.feed.is_stale
+        assert streamer.last_update_id is None
+
+        server.frozen = False
+        assert await wait_for(lambda: streamer.book_valid)
+        assert not streamer.feed.is_stale
+
+    run_scenario(scenario)
+
+def test_delayed_primary_promotes_standby():
+    async def scenario(streamer, primary, standby):
+        feed = streamer.feed
+        assert await wait_for(lambda: all(c.messages for c in feed.connections))
+        feed.active = feed.connections[0]
+
+        primary.delay = STALE_AFTER / 2
+        assert await wait_for(lambda: feed.active is feed.connections[1])
+        assert feed.failovers >= 1
+        assert streamer.book_valid
+
+    run_scenario(scenario, servers=2)
+
+def test_jitter_does_not_flap_between_healthy_connections():
+    async def scenario(streamer, primary, standby):
+        feed = streamer.feed
+        assert await wait_for(lambda: all(c.messages for c in feed.connections))
+        failovers = feed.failovers
+        primary.jitter = standby.jitter = 0.01
+
+        await asyncio.sleep(2)
+        assert feed.failovers == failovers
+
+    run_scenario(scenario, servers=2)
+
+def test_older_book_is_dropped():
+    streamer = DataStreamer()
+    frame = '{{"lastUpdateId": {}, "bids": [["{}", "1.0"]], "asks": [["{}", "1.0"]]}}'
+    streamer._on_depth_message(frame.format(10, 100.0, 101.0))
+    streamer._on_depth_message(frame.format(9, 90.0, 91.0))
+    streamer._on_depth_message(frame.format(10, 95.0, 96.0))
+
+    assert streamer.binance_depth_bids[0].price == 100.0
+    assert streamer.out_of_order_frames == 2
+
+    streamer._on_depth_message(frame.format(11, 102.0, 103.0))
+    assert streamer.binance_depth_bids[0].price == 102.0
@@ -0,0 +1,69 @@
+"""Liquidation cluster index: fixture ingestion, bisect boundaries and full-map replacement."""
+from pathlib import Path
+
+import pytest
+
+from services.data_streamer import DataStreamer
+from services.liquidation_map import LiquidationMap
+
+FIXTURE = Path(__file__).parent / "fixtures" / "liquidation_map.json"
+SIGNIFICANT = 5_000_000
+
+@pytest.fixture
+def liquidation_map() -> LiquidationMap:
+    levels = DataStreamer(liquidation_map_fixture=str(FIXTURE)).fetch_liquidation_levels()
+    index = LiquidationMap(bucket_size=50.0, min_volume=SIGNIFICANT)
+    index.update(levels)
+    return index
+
+def test_fixture_levels_are_bucketed_and_summed(liquidation_map):
+    levels = dict((price, volume) for price, volume in liquidation_map.to_levels())
+    assert levels[59725.0] == 6_000_000  # 59730 + 59740 share a bucket
+    assert levels[59925.0] == 2_000_000
+    assert len(liquidation_map) == 6
+
+def test_nearest_clusters_skip_insignificant_buckets(liquidation_map):
+    below = liquidation_map.nearest_below(60000.0, within_pct=0.02)
+    above = liquidation_map.nearest_above(60000.0, within_pct=0.02)
+    assert below.price == 59725.0  # 59925 holds only 2M
+    assert above.price == 60025.0
+    assert above.distance_pct == pytest.approx(25 / 60000)
+
+def test_price_on_a_bucket_midpoint_is_neither_above_nor_below(liquidation_map):
+    assert liquidation_map.nearest_above(60025.0, within_pct=0.02).price == 60425.0
+    assert liquidation_map.nearest_below(60025.0, within_pct=0.02).price == 59725.0
+
+def test_within_pct_cutoff(liquidation_map):
+    # A cluster exactly at the edge of the window is included; just beyond it is not
+    price = 60500.0
+    distance = (61925.0 - price) / price
+    assert liquidation_map.nearest_above(price, within_pct=distance + 1e-9).price == 61925.0
+    assert liquidation_map.nearest_above(price, within_pct=distance - 1e-9) is None
+
+    distance = (price - 60425.0) / price
+    assert liquidation_map.nearest_below(price, within_pct=distance + 1e-9).price == 60425.0
+    assert liquidation_map.nearest_below(price, within_pct=distance - 1e-9) is None
+
+def test_bucket_crossing_significance_threshold_both_ways(liquidation_map):
+    assert liquidation_map.nearest_below(60000.0, within_pct=0.02).price == 59725.0
+
+    liquidation_map.update([(59910.0, SIGNIFICANT)])  # 2M -> 5M: becomes significant
+    assert liquidation_map.nearest_below(60000.0, within_pct=0.02).price == 59925.0
+
+    liquidation_map.update([(59910.0, SIGNIFICANT - 1)])  # Drops back below the threshold
+    assert liquidation_map.nearest_below(60000.0, within_pct=0.02).price == 59725.0
+    assert 59925.0 in dict((p, v) for p, v in liquidation_map.to_levels())
+
+    liquidation_map.update([(59910.0, 0.0)])  # Gone entirely
+    assert 59925.0 not in dict((p, v) for p, v in liquidation_map.to_levels())
+
+def test_replace_drops_clusters_missing_from_a_full_map():
+    index = LiquidationMap(bucket_size=50.0, min_volume=1)
+    index.update([(60000, 10), (61000, 10)])
+    index.update([(62000, 10)])
+    assert index.nearest_below(61500, within_pct=0.1).price == 61025.0  # Merge keeps old buckets
+
+    index.update([(62000, 10)], replace=True)
+    assert index.nearest_below(61500, within_pct=0.1) is None
+    assert index.nearest_above(61500, within_pct=0.1).price == 62025.0
+    assert len(index) == 1
@@ -0,0 +1,73 @@
+"""Stall recording, attribution and lag percentiles in the event-loop monitor."""
+import asyncio
+import time
+import traceback
+
+from services.loop_monitor import LoopMonitor
+
+def frames(*paths):
+    return [traceback.FrameSummary(path, 1, "f") for path in paths]
+
+def test_one_entry_per_stall():
+    async def main():
+        monitor = LoopMonitor(interval=0.01, stall_threshold=0.05, sample_interval=0.01)
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.1)
+
+        time.sleep(0.5)  # One long stall...
+        await asyncio.sleep(0.1)
+        time.sleep(0.2)  # ...then a second, shorter one
+        await asyncio.sleep(0.1)
+        task.cancel()
+        return monitor.get_stats()
+
+    stats = asyncio.run(main())
+    stalls = stats["recent_stalls"]
+    assert len(stalls) == 2
+    assert stalls[0]["blocked_ms"] >= 350
+    assert stalls[0]["samples"] > 10
+    assert stalls[1]["blocked_ms"] < stalls[0]["blocked_ms"]
+    assert all("test_loop_monitor.py" in "".join(s["stack"]) for s in stalls)
+
+def test_watchdog_stops_with_probe():
+    monitor = LoopMonitor(interval=0.01, stall_threshold=0.05, sample_interval=0.01)
+
+    async def main():
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    asyncio.run(main())
+    monitor._watchdog.join(timeout=1)
+    assert not monitor._watchdog.is_alive()
+
+    time.sleep(0.2)  # The probe is gone; this must not be recorded as a stall
+    assert monitor.get_stats()["recent_stalls"] == []
+    assert sum(monitor.stall_samples.values()) == 0
+
+def test_innermost_service_frame_wins():
+    stack = frames(
+        "/app/src/main.py",
+        "/app/src/services/trading_engine.py",
+        "/app/src/services/trader.py",
+        "/usr/lib/python3/site-packages/requests/sessions.py"
+    )
+    assert LoopMonitor._attribute(stack) == "trader"
+    assert LoopMonitor._attribute(stack[:2]) == "engine"
+
+def test_strategies_package_wildcard():
+    stack = frames("/app/src/services/strategy_ensemble.py", "/app/src/strategies/momentum.py")
+    assert LoopMonitor._attribute(stack) == "strategies"
+    assert LoopMonitor._attribute(frames("/app/src/other/momentum.py")) == "other"
+
+def test_lag_percentiles():
+    monitor = LoopMonitor()
+    monitor.lags.extend(i / 1000 for i in range(1, 101))  # 1..100 ms
+
+    stats = monitor.get_stats()
+    assert stats["samples"] == 100
+    assert stats["p50_ms"] == 51.0
+    assert stats["p95_ms"] == 96.0
+    assert stats["p99_ms"] == 100.0
+    assert stats["max_ms"] == 100.0
+    assert LoopMonitor().get_stats()["p50_ms"] is None
@@ -0,0 +1,146 @@
+"""Snapshot persistence: round-trip, atomic writes, freshness checks and corrupt files."""
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import services.snapshot_service as snapshot_module
+from api.server import app
+from helpers.constants import SNAPSHOT_MARKET_MAX_AGE, SNAPSHOT_MAX_AGE, SNAPSHOT_SIGNALS_MAX_AGE
+from helpers.service_locator import service_locator
+from models.internal import BookLevel, BookWalls, OddsSnapshot, SignalSnapshot
+from models.market import LiquidationData
+from models.polymarket import MarketInfo
+from services.data_streamer import DataStreamer
+from services.snapshot_service import SnapshotService
+from services.trading_engine import TradingEngine
+
+def make_state():
+    engine, streamer = TradingEngine(), DataStreamer()
+    market = MarketInfo(
+        condition_id="0xabc",
+        question="Bitcoin Up or Down (15 min)",
+        yes_token="up",
+        no_token="down",
+        active=True,
+        strike=60000.0,
+        end_time=datetime.now(timezone.utc) + timedelta(minutes=10),
+        yes_price=0.55,
+        no_price=0.45
+    )
+    engine.market, engine.markets = market, [market]
+    engine.latest_signals = SignalSnapshot(
+        timestamp=datetime.now(),
+        btc_price=60010.0,
+        order_book=BookWalls(top_bid_walls=[], top_ask_walls=[]),
+        funding=None,
+        liquidations=LiquidationData(short_vol=1.0, long_vol=2.0)
+    )
+    engine.latest_odds = OddsSnapshot(yes_price=0.55, no_price=0.45)
+    engine.latest_brief = {"decision": "BUY_UP", "condition_id": "0xabc"}
+    engine.history.append({"btc_price": 60010.0})
+    streamer.restore_book([BookLevel(60000.0, 1.5)], [BookLevel(60001.0, 2.5)], time.time())
+    streamer.liquidation_map.update([(61000.0, 5e6)])
+    return engine, streamer
+
+def age_snapshot(service: SnapshotService, seconds: float):
+    snapshot = json.loads(service.path.read_text())
+    snapshot["captured_at"] -= seconds
+    snapshot["book"]["updated_at"] -= seconds
+    service.path.write_text(json.dumps(snapshot))
+
+@pytest.fixture
+def service(tmp_path):
+    return SnapshotService(path=str(tmp_path / "state" / "snapshot.json"))
+
+def test_save_restore_round_trip(service):
+    engine, streamer = make_state()
+    asyncio.run(service.save(engine, streamer))
+
+    restored_engine, restored_streamer = TradingEngine(), DataStreamer()
+    assert asyncio.run(service.restore(restored_engine, restored_streamer))
+
+    assert restored_engine.market == engine.market
+    assert restored_engine.markets == engine.markets
+    assert restored_engine.latest_signals == engine.latest_signals
+    assert restored_engine.latest_odds == engine.latest_odds
+    assert restored_engine.latest_brief == dict(engine.latest_brief, restored=True)
+    assert list(restored_engine.history) == list(engine.history)
+    assert restored_streamer.book_valid
+    assert restored_streamer.binance_depth_bids == streamer.binance_depth_bids
+    assert restored_streamer.binance_depth_asks == streamer.binance_depth_asks
+    assert restored_streamer.liquidation_map.to_levels() == streamer.liquidation_map.to_levels()
+
+def test_write_is_atomic(service, monkeypatch):
+    engine, streamer = make_state()
+    asyncio.run(service.save(engine, streamer))
+    original = service.path.read_text()
+    assert not service.path.with_suffix(".tmp").exists()
+
+    def failing_dump(obj, f, **kwargs):
+        f.write('{"version": 1, "capt')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(snapshot_module.json, "dump", failing_dump)
+    with pytest.raises(OSError):
+        asyncio.run(service.save(engine, streamer))
+    assert service.path.read_text() == original
+
+def test_snapshot_past_max_age_is_ignored(service):
+    engine, streamer = make_state()
+    asyncio.run(service.save(engine, streamer))
+    age_snapshot(service, SNAPSHOT_MAX_AGE + 1)
+
+    restored_engine, restored_streamer = TradingEngine(), DataStreamer()
+    assert not asyncio.run(service.restore(restored_engine, restored_streamer))
+    assert restored_engine.market is None
+    assert not restored_streamer.book_valid
+
+def test_sections_have_their_own_max_age(service):
+    engine, streamer = make_state()
+    asyncio.run(service.save(engine, streamer))
+    age_snapshot(service, (SNAPSHOT_SIGNALS_MAX_AGE + SNAPSHOT_MARKET_MAX_AGE) / 2)
+
+    restored_engine, restored_streamer = TradingEngine(), DataStreamer()
+    assert asyncio.run(service.restore(restored_engine, restored_streamer))
+    assert restored_engine.market == engine.market
+    assert restored_engine.latest_signals is None
+    assert restored_engine.latest_brief is None
+    assert not restored_streamer.book_valid  # Book max age is seconds
+
+def test_truncated_file_is_rejected(service):
+    engine, streamer = make_state()
+    asyncio.run(service.save(engine, streamer))
+    text = service.path.read_text()
+    service.path.write_text(text[: len(text) // 2])
+
+    assert not asyncio.run(service.restore(TradingEngine(), DataStreamer()))
+
+def test_corrupt_section_restores_nothing(service):
+    engine, streamer = make_state()
+    asyncio.run(service.save(engine, streamer))
+    snapshot = json.loads(service.path.read_text())
+    snapshot["signals"]["btc_price"] = "not a price"
+    service.path.write_text(json.dumps(snapshot))
+
+    restored_engine, restored_streamer = TradingEngine(), DataStreamer()
+    assert not asyncio.run(service.restore(restored_engine, restored_streamer))
+    assert restored_engine.market is None
+    assert restored_engine.markets == []
+    assert not restored_streamer.book_valid
+    assert restored_streamer.liquidation_map.to_levels() == []
+
+def test_confirm_rejects_restored_brief():
+    engine = TradingEngine()
+    service_locator.register(TradingEngine, engine)
+    client = TestClient(app)
+
+    engine.latest_brief = {"decision": "BUY_UP", "restored": True}
+    assert client.post("/trade/confirm", json={"command": "CONTINUE"}).status_code == 409
+    assert engine.confirmation_queue.empty()
+
+    engine.latest_brief = {"decision": "BUY_UP"}
+    assert client.post("/trade/confirm", json={"command": "CONTINUE"}).status_code == 200
@@ -0,0 +1,40 @@
+"""Leak and stall flags in the soak report."""
+from simulators.soak import analyse
+
+def make_samples(duration: float, step: float, rss_mb) -> list:
+    samples = []
+    for i in range(int(duration / step) + 1):
+        t = i * step
+        samples.append({
+            "t": t,
+            "rss_mb": rss_mb(t),
+            "threads": 6,
+            "tasks": 12,
+            "confirmations": 0,
+            "ticks": i,
+            "feed_stale": False,
+            "feed_sent": i * 10,
+            "feed_received": i * 10,
+            "briefs": 0,
+            "suggestions_bytes": 0,
+            "api_requests": 0,
+            "api_errors": 0
+        })
+    return samples
+
+def memory_flags(report: dict) -> list:
+    return [flag for flag in report["flags"] if flag.startswith("Memory")]
+
+def test_short_run_warm_up_growth_is_not_a_leak():
+    # ~1 MB over 40s is well above the slope limit per hour, but is warm-up noise
+    report = analyse(make_samples(40, 1, lambda t: 100 + t / 40), {}, 1.0)
+    assert report["memory_slope_mb_per_hour"] > 20
+    assert memory_flags(report) == []
+
+def test_long_run_steady_growth_is_flagged():
+    report = analyse(make_samples(3600, 10, lambda t: 100 + t / 60), {}, 1.0)  # 60 MB/h
+    assert len(memory_flags(report)) == 1
+
+def test_long_run_small_growth_is_not_flagged():
+    report = analyse(make_samples(1200, 10, lambda t: 100 + t / 120), {}, 1.0)  # 10 MB total
+    assert memory_flags(report) == []
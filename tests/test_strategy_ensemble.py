@@ -0,0 +1,77 @@
+"""Strategy ensemble execution modes: inline, thread pool and process pool."""
+import asyncio
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+from models.ai import AIDecision
+from models.internal import BookWalls, OddsSnapshot, SignalSnapshot
+from models.market import LiquidationData
+from services.strategy_ensemble import StrategyEnsemble
+from strategies.base import Strategy
+
+class ProcessStrategy(Strategy):
+    name = "process"
+    cpu_bound = True
+
+    def evaluate(self, features, signals, odds) -> AIDecision:
+        return AIDecision(action="BUY_UP", confidence=0.9, reasoning=str(os.getpid()))
+
+class ThreadStrategy(Strategy):
+    name = "thread"
+    blocking = True
+
+    def evaluate(self, features, signals, odds) -> AIDecision:
+        return AIDecision(action="BUY_UP", confidence=0.8, reasoning=threading.current_thread().name)
+
+class InlineStrategy(Strategy):
+    name = "inline"
+
+    def evaluate(self, features, signals, odds) -> AIDecision:
+        return AIDecision(action="BUY_UP", confidence=0.7, reasoning=threading.current_thread().name)
+
+def make_snapshot():
+    signals = SignalSnapshot(
+        timestamp=datetime.now(),
+        btc_price=60000.0,
+        order_book=BookWalls(top_bid_walls=[], top_ask_walls=[]),
+        funding=None,
+        liquidations=LiquidationData(short_vol=0.0, long_vol=0.0)
+    )
+    return signals, OddsSnapshot(yes_price=0.5, no_price=0.5)
+
+def test_each_strategy_runs_where_its_flags_say():
+    ensemble = StrategyEnsemble([ProcessStrategy(), ThreadStrategy(), InlineStrategy()], aggregation="vote")
+    signals, odds = make_snapshot()
+    try:
+        decision = asyncio.run(ensemble.decide(signals, odds, None))
+    finally:
+        ensemble.shutdown()
+
+    where = {r.name: r.reasoning for r in ensemble.latest_results}
+    assert where["process"] != str(os.getpid())
+    assert where["thread"].startswith("strategy")
+    assert where["inline"] == threading.current_thread().name
+    assert decision.action == "BUY_UP"
+    assert ensemble.get_stats()["strategies"]["process"]["runs"] == 1
+
+def test_shutdown_releases_pools_and_they_are_recreated_on_use():
+    ensemble = StrategyEnsemble([ProcessStrategy(), ThreadStrategy()], aggregation="vote")
+    signals, odds = make_snapshot()
+
+    asyncio.run(ensemble.decide(signals, odds, None))
+    process_pool, thread_pool = ensemble._process_pool, ensemble._thread_pool
+    ensemble.shutdown()
+    assert ensemble._process_pool is None and ensemble._thread_pool is None
+    for pool in (process_pool, thread_pool):
+        with pytest.raises(RuntimeError):
+            pool.submit(os.getpid)
+    ensemble.shutdown()  # Idempotent
+
+    try:
+        asyncio.run(ensemble.decide(signals, odds, None))
+        assert all(r.action == "BUY_UP" for r in ensemble.latest_results)
+    finally:
+        ensemble.shutdown()